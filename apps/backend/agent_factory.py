@@ -372,8 +372,7 @@ class AgentFactory:
         # Use the agent's answer generation with enhanced context
         try:
             import openai
-            response = await asyncio.to_thread(
-                managed_agent.agent.openai_client.chat.completions.create,
+            response = await managed_agent.agent.openai_client.chat.completions.create(
                 model="openai/gpt-4o-mini",
                 messages=[
                     {
@@ -5,15 +5,29 @@ Implements hierarchical information processing with consciousness emergence at c
 """
 
 import asyncio
+import hashlib
+import heapq
 import json
 import math
 import numpy as np
-from datetime import datetime, timedelta
+from collections import Counter, deque
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import chain, count
+from operator import attrgetter
 from typing import Dict, List, Optional, Any, Tuple, Set
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field, asdict
 from enum import Enum
-import psycopg
-from psycopg.rows import dict_row
+
+try:
+    import orjson
+except ImportError:  # json.dumps fallback for content fingerprints
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:  # per-keyword substring scans instead
+    ahocorasick = None
 
 class CascadeLayerType(Enum):
     """Types of cascade processing layers"""
@@ -40,7 +54,7 @@ class InformationType(Enum):
     META_KNOWLEDGE = "meta_knowledge"
     CONSCIOUS_AWARENESS = "conscious_awareness"
 
-@dataclass
+@dataclass(slots=True)
 class InformationPacket:
     """Unit of information flowing through cascades"""
     packet_id: str
@@ -53,6 +67,49 @@ class InformationPacket:
     coherence_score: float
     integration_requirements: List[str]
     metadata: Dict[str, Any]
+    # Lookups for IntegrationLayer similarity; content and requirements are not
+    # modified once a packet exists, so these are derived once per packet
+    _content_keys: frozenset = field(init=False, repr=False, compare=False)
+    _req_bits: int = field(init=False, repr=False, compare=False)
+    _word_sets: Dict[str, frozenset] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _fingerprint: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    _lowered: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _hits: Optional[frozenset] = field(default=None, init=False, repr=False, compare=False)
+    # timestamp as integer microseconds since the epoch, for cheap exact time differences
+    _ts_us: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._content_keys = frozenset(self.content)
+        self._req_bits = _requirement_bits(self.integration_requirements)
+        self._ts_us = _epoch_us(self.timestamp)
+    
+    def _words(self, key: str) -> frozenset:
+        """Lower-cased word set of the string content value under `key` (cached)"""
+        words = self._word_sets.get(key)
+        if words is None:
+            words = self._word_sets[key] = frozenset(self.content[key].lower().split())
+        return words
+    
+    def _content_text(self) -> str:
+        """str(content).lower() (cached)"""
+        if self._lowered is None:
+            self._lowered = str(self.content).lower()
+        return self._lowered
+    
+    def _keyword_hits(self) -> frozenset:
+        """Which of the watched _CONTENT_KEYWORDS occur in the content's text leaves (cached)"""
+        if self._hits is None:
+            hits = set()
+            for text in _iter_text_leaves(self.content):
+                hits |= _find_keywords(text)
+            self._hits = frozenset(hits)
+        return self._hits
+    
+    def content_fingerprint(self) -> int:
+        """64-bit hash of the canonical (key-sorted) content, for exact-duplicate checks (cached)"""
+        if self._fingerprint is None:
+            self._fingerprint = _content_fingerprint(self.content)
+        return self._fingerprint
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for processing"""
@@ -69,7 +126,7 @@ class InformationPacket:
             'metadata': self.metadata
         }
 
-@dataclass
+@dataclass(slots=True)
 class CascadeState:
     """Current state of information cascade"""
     cascade_id: str
@@ -100,7 +157,7 @@ class CascadeState:
         else:
             return ConsciousnessLevel.NONE
 
-@dataclass
+@dataclass(slots=True)
 class FeedbackSignal:
     """Feedback signal flowing back through cascade layers"""
     signal_id: str
@@ -119,6 +176,247 @@ class FeedbackSignal:
             print(f"❌ Error applying feedback signal {self.signal_id}: {e}")
             return False
 
+def _mean(xs: List[float]) -> float:
+    """Mean of a short Python list; np.mean's dispatch costs more than the sum itself"""
+    return sum(xs) / len(xs) if xs else 0.0
+
+# Numeric kernels for PreprocessingLayer; only worth their dispatch cost on longer series
+_NUMERIC_KERNEL_MIN_LEN = 16
+
+def _norm_minmax_np(a: np.ndarray) -> np.ndarray:
+    """Min-max normalize a float64 array (all 0.5 when constant)"""
+    lo = a.min()
+    hi = a.max()
+    if hi == lo:
+        return np.full(a.shape, 0.5)
+    return (a - lo) / (hi - lo)
+
+def _mse_normalized_pair_np(a: np.ndarray, b: np.ndarray) -> float:
+    """Mean squared difference of two equal-length arrays after min-max normalizing each"""
+    return float(np.mean((_norm_minmax_np(a) - _norm_minmax_np(b)) ** 2))
+
+# Loop kernels for Numba (optional, see requirements.txt). Numba is imported and
+# the kernels compiled on the first series long enough to use them, not at import,
+# and without cache=True so nothing is written next to the module.
+def _norm_minmax_loops(a):
+    lo = a[0]
+    hi = a[0]
+    for x in a:
+        if x < lo:
+            lo = x
+        elif x > hi:
+            hi = x
+    out = np.empty(a.shape[0])
+    if hi == lo:
+        out[:] = 0.5
+        return out
+    span = hi - lo
+    for i in range(a.shape[0]):
+        out[i] = (a[i] - lo) / span
+    return out
+
+def _mse_normalized_pair_loops(a, b):
+    # min/max of both halves in one pass, then normalize and accumulate without temporaries
+    lo_a = hi_a = a[0]
+    lo_b = hi_b = b[0]
+    for i in range(a.shape[0]):
+        lo_a = min(lo_a, a[i])
+        hi_a = max(hi_a, a[i])
+        lo_b = min(lo_b, b[i])
+        hi_b = max(hi_b, b[i])
+    span_a = hi_a - lo_a
+    span_b = hi_b - lo_b
+    total = 0.0
+    for i in range(a.shape[0]):
+        x = (a[i] - lo_a) / span_a if span_a != 0.0 else 0.5
+        y = (b[i] - lo_b) / span_b if span_b != 0.0 else 0.5
+        total += (x - y) ** 2
+    return total / a.shape[0]
+
+# (norm_minmax, mse_normalized_pair), chosen on first use
+_numeric_kernels = None
+
+def _load_numeric_kernels():
+    global _numeric_kernels
+    try:
+        from numba import njit
+    except ImportError:  # NumPy kernels instead
+        _numeric_kernels = (_norm_minmax_np, _mse_normalized_pair_np)
+    else:
+        _numeric_kernels = (njit(_norm_minmax_loops), njit(_mse_normalized_pair_loops))
+    return _numeric_kernels
+
+def _norm_minmax(a: np.ndarray) -> np.ndarray:
+    return (_numeric_kernels or _load_numeric_kernels())[0](a)
+
+def _mse_normalized_pair(a: np.ndarray, b: np.ndarray) -> float:
+    return (_numeric_kernels or _load_numeric_kernels())[1](a, b)
+
+def _contains_value(obj: Any, needle: str) -> bool:
+    """
+    True if `needle` occurs in any key or scalar value of a nested dict/list structure.
+    Walks the structure instead of matching against str(obj), so no repr of the
+    whole content is built and the walk stops at the first hit.
+    """
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            if needle in item:
+                return True
+        elif isinstance(item, dict):
+            for k, v in item.items():
+                if isinstance(k, str) and needle in k:
+                    return True
+                stack.append(v)
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif needle in str(item):  # numbers, bools, None, datetimes...
+            return True
+    return False
+
+def _content_fingerprint(content: Dict[str, Any]) -> int:
+    """64-bit BLAKE2b digest of content serialized with sorted keys"""
+    try:
+        if orjson is not None:
+            serialized = orjson.dumps(content, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+        else:
+            serialized = json.dumps(content, sort_keys=True, default=str).encode()
+    except TypeError:  # keys json can't sort, or ints orjson can't encode: keep insertion order
+        serialized = json.dumps(content, default=str).encode()
+    return int.from_bytes(hashlib.blake2b(serialized, digest_size=8).digest(), 'little')
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = _EPOCH.replace(tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+def _epoch_us(ts: datetime) -> int:
+    """Microseconds since the epoch; (a - b) / 1e6 equals (ts_a - ts_b).total_seconds()"""
+    return (ts - (_EPOCH if ts.tzinfo is None else _EPOCH_UTC)) // _MICROSECOND
+
+# MetaCognitiveLayer._is_requirement_fulfilled: content keywords that satisfy each
+# known requirement (an unknown requirement is satisfied by its own name)
+_REQUIREMENT_KEYWORDS = {
+    'feature_binding': ('features', 'binding', 'association'),
+    'temporal_integration': ('temporal', 'time', 'sequence'),
+    'pattern_matching': ('pattern', 'match', 'similarity'),
+    'contextual_binding': ('context', 'background', 'environment'),
+    'conceptual_binding': ('concept', 'abstract', 'meaning'),
+    'semantic_integration': ('semantic', 'meaning', 'significance'),
+    'self_awareness': ('self', 'awareness', 'consciousness'),
+    'cognitive_monitoring': ('cognitive', 'monitoring', 'assessment')
+}
+
+# Integration requirement -> bit; a packet's requirements become one int so overlap
+# is two popcounts instead of two set operations. The layers' own vocabulary is
+# interned up front, any other requirement gets the next bit on first sight.
+_REQUIREMENT_BITS: Dict[str, int] = {
+    requirement: 1 << i
+    for i, requirement in enumerate([*_REQUIREMENT_KEYWORDS, 'feature_extraction'])
+}
+
+def _requirement_bits(requirements: List[str]) -> int:
+    bits = 0
+    for requirement in requirements:
+        bit = _REQUIREMENT_BITS.get(requirement)
+        if bit is None:
+            bit = _REQUIREMENT_BITS[requirement] = 1 << len(_REQUIREMENT_BITS)
+        bits |= bit
+    return bits
+
+def _requirement_overlap(bits1: int, bits2: int) -> float:
+    """Jaccard overlap of two requirement bitmaps"""
+    return (bits1 & bits2).bit_count() / max(1, (bits1 | bits2).bit_count())
+
+# IntegrationLayer: mean similarity a packet must exceed to be integrated
+_INTEGRATION_THRESHOLD = 0.7
+
+# Information type compatibility, checked in both directions; same type is always compatible
+_TYPE_COMPATIBILITY = {
+    (InformationType.SENSORY_INPUT, InformationType.PROCESSED_DATA): 0.9,
+    (InformationType.PROCESSED_DATA, InformationType.PATTERN_RECOGNITION): 0.9,
+    (InformationType.PATTERN_RECOGNITION, InformationType.CONCEPTUAL_KNOWLEDGE): 0.8,
+    (InformationType.CONCEPTUAL_KNOWLEDGE, InformationType.META_KNOWLEDGE): 0.7,
+    (InformationType.META_KNOWLEDGE, InformationType.CONSCIOUS_AWARENESS): 0.6,
+}
+_TYPE_INDEX = {info_type: i for i, info_type in enumerate(InformationType)}
+_TYPE_COMPAT = np.eye(len(_TYPE_INDEX))
+for (_t1, _t2), _compat in _TYPE_COMPATIBILITY.items():
+    _TYPE_COMPAT[_TYPE_INDEX[_t1], _TYPE_INDEX[_t2]] = _TYPE_COMPAT[_TYPE_INDEX[_t2], _TYPE_INDEX[_t1]] = _compat
+del _t1, _t2, _compat
+# Same table as nested lists: scalar lookups return a Python float without a NumPy scalar
+_TYPE_COMPAT_ROWS = _TYPE_COMPAT.tolist()
+
+# Sentiment lexicon for SensoryLayer._analyze_sentiment (hashed lookups)
+_POSITIVE_WORDS = frozenset({'good', 'great', 'excellent', 'positive', 'success', 'achievement'})
+_NEGATIVE_WORDS = frozenset({'bad', 'terrible', 'negative', 'failure', 'problem', 'error'})
+
+# SensoryLayer._detect_temporal_pattern: time of day by hour (0-23)
+_HOUR_TABLE = tuple(
+    'morning' if 6 <= hour < 12 else
+    'afternoon' if 12 <= hour < 18 else
+    'evening' if 18 <= hour < 22 else
+    'night'
+    for hour in range(24)
+)
+
+# PreprocessingLayer._detect_structural_patterns: keys of a richly structured packet
+_COMMON_STRUCT_KEYS = ('text', 'numerical_data', 'categories', 'metadata')
+
+# MetaCognitiveLayer: substrings marking self-referential content
+_SELF_REFS = ('self', 'consciousness', 'awareness', 'thinking', 'knowing')
+
+# MetaCognitiveLayer._calculate_consciousness_indicators: insight types (from the
+# _assess_* helpers) about consciousness or the self, which count as self-awareness
+_SELF_AWARENESS_INSIGHTS = frozenset({'consciousness_emergence_potential'})
+
+# ConsciousnessLayer._calculate_self_reference_level: each one present counts once
+_SELF_REFERENCE_WORDS = frozenset(_SELF_REFS + (
+    'understanding', 'processing', 'cognitive', 'meta', 'reflection'
+))
+
+# Every keyword the content heuristics look for; one scan of a packet's text finds them all
+_CONTENT_KEYWORDS = frozenset(
+    keyword for keywords in _REQUIREMENT_KEYWORDS.values() for keyword in keywords
+) | _SELF_REFERENCE_WORDS
+
+if ahocorasick is not None:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in _CONTENT_KEYWORDS:
+        _KEYWORD_AUTOMATON.add_word(_keyword, _keyword)
+    _KEYWORD_AUTOMATON.make_automaton()
+    del _keyword
+
+def _iter_text_leaves(obj: Any):
+    """
+    Lower-cased text pieces of nested content: string keys and values, and repr() of
+    leaves that are neither containers nor numbers. Keywords (letters and underscores)
+    found in these are the ones found in str(obj).lower(), because repr's separators
+    are never letters; numbers are skipped since their repr can't hold a keyword.
+    """
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            yield item.lower()
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+            stack.extend(item.keys())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif item is not None and not isinstance(item, (int, float)):
+            yield repr(item).lower()
+
+def _find_keywords(text: str) -> frozenset:
+    """The _CONTENT_KEYWORDS occurring anywhere in `text` (substring matches)"""
+    if ahocorasick is not None:
+        return frozenset(keyword for _, keyword in _KEYWORD_AUTOMATON.iter(text))
+    return frozenset(keyword for keyword in _CONTENT_KEYWORDS if keyword in text)
+
+def _chain_values(values: List[Any]):
+    """The items of list values and the non-list values themselves, in order"""
+    return chain.from_iterable(v if isinstance(v, list) else (v,) for v in values)
+
 class CascadeLayer:
     """Base class for cascade processing layers"""
     
@@ -137,7 +435,7 @@ class CascadeLayer:
         """Process an information packet through this layer"""
         if len(self.active_packets) >= self.capacity:
             # Layer at capacity - prioritize processing
-            await self._prioritize_processing()
+            self._prioritize_processing()
         
         self.active_packets.append(packet)
         
@@ -149,29 +447,37 @@ class CascadeLayer:
         
         return processed_packets
     
+    async def process_batch(self, packets: List[InformationPacket]) -> List[List[InformationPacket]]:
+        """Process a burst of independent packets concurrently; results are in input order"""
+        return await asyncio.gather(*(self.process_packet(p) for p in packets))
+    
     async def _layer_specific_processing(self, packet: InformationPacket) -> List[InformationPacket]:
         """Override in subclasses for specific processing logic"""
         return [packet]
     
-    async def _prioritize_processing(self):
+    def _prioritize_processing(self):
         """Prioritize packets when layer is at capacity"""
-        # Sort by priority and remove lowest priority packets
-        self.active_packets.sort(key=lambda p: p.priority, reverse=True)
+        # Keep the highest priority packets (same order as a stable descending sort), drop the rest
         removed_count = max(1, len(self.active_packets) - self.capacity + 10)
-        self.active_packets = self.active_packets[:-removed_count]
+        keep = len(self.active_packets) - removed_count
+        self.active_packets = heapq.nlargest(keep, self.active_packets, key=attrgetter('priority'))
     
     def _update_performance_metrics(self, input_packet: InformationPacket, output_packets: List[InformationPacket]):
         """Update layer performance metrics"""
         self.performance_metrics['throughput'] = len(output_packets) / max(1, len(self.active_packets))
         
         if output_packets:
-            avg_coherence = np.mean([p.coherence_score for p in output_packets])
-            self.performance_metrics['coherence'] = avg_coherence
+            # One pass over the outputs for both metrics
+            total_coherence = 0.0
+            total_requirements = 0
+            for p in output_packets:
+                total_coherence += p.coherence_score
+                total_requirements += len(p.integration_requirements)
+            n_out = len(output_packets)
+            self.performance_metrics['coherence'] = total_coherence / n_out
             
             # Integration success based on how well requirements are met
-            integration_success = sum(
-                len(p.integration_requirements) for p in output_packets
-            ) / max(1, len(output_packets))
+            integration_success = total_requirements / n_out
             self.performance_metrics['integration_success'] = min(1.0, integration_success / 5.0)
     
     def process_feedback(self, feedback: FeedbackSignal) -> bool:
@@ -221,7 +527,7 @@ class CascadeLayer:
                 if packet.priority < value:
                     return False
             elif key == 'content_contains':
-                if value not in str(packet.content):
+                if not _contains_value(packet.content, value):
                     return False
         return True
     
@@ -245,6 +551,12 @@ class SensoryLayer(CascadeLayer):
             'novelty_boost': 1.2,
             'familiarity_decay': 0.9
         }
+        # Content key -> feature extractor returning that key's features
+        self._extractors = {
+            'text': self._feat_text,
+            'numerical_data': self._feat_numeric,
+            'categories': self._feat_categories
+        }
     
     async def _layer_specific_processing(self, packet: InformationPacket) -> List[InformationPacket]:
         """Process sensory information"""
@@ -253,7 +565,7 @@ class SensoryLayer(CascadeLayer):
         # Apply sensory filtering
         if self._passes_sensory_filter(packet):
             # Extract features from sensory input
-            features = await self._extract_sensory_features(packet)
+            features = self._extract_sensory_features(packet)
             
             # Create processed packet
             processed_packet = InformationPacket(
@@ -282,38 +594,50 @@ class SensoryLayer(CascadeLayer):
         relevance = packet.content.get('relevance_score', 0.5)
         return relevance >= self.sensory_filters['relevance_threshold']
     
-    async def _extract_sensory_features(self, packet: InformationPacket) -> Dict[str, Any]:
+    def _extract_sensory_features(self, packet: InformationPacket) -> Dict[str, Any]:
         """Extract features from sensory input"""
-        content = packet.content
         features = {}
         
-        # Extract basic features
-        if 'text' in content:
-            features['text_length'] = len(content['text'])
-            features['word_count'] = len(content['text'].split())
-            features['sentiment'] = self._analyze_sentiment(content['text'])
-        
-        if 'numerical_data' in content:
-            features['data_range'] = self._calculate_data_range(content['numerical_data'])
-            features['data_complexity'] = self._assess_data_complexity(content['numerical_data'])
-        
-        if 'categories' in content:
-            features['category_count'] = len(content['categories'])
-            features['primary_category'] = content['categories'][0] if content['categories'] else 'unknown'
+        # Extract basic features, one pass over the content keys
+        for key, value in packet.content.items():
+            extractor = self._extractors.get(key)
+            if extractor is not None:
+                features.update(extractor(value))
         
         # Extract temporal features
         features['temporal_pattern'] = self._detect_temporal_pattern(packet)
         
         return features
     
-    def _analyze_sentiment(self, text: str) -> float:
-        """Simple sentiment analysis"""
-        positive_words = ['good', 'great', 'excellent', 'positive', 'success', 'achievement']
-        negative_words = ['bad', 'terrible', 'negative', 'failure', 'problem', 'error']
-        
-        words = text.lower().split()
-        positive_count = sum(1 for word in words if word in positive_words)
-        negative_count = sum(1 for word in words if word in negative_words)
+    def _feat_text(self, text: str) -> Dict[str, Any]:
+        return {
+            'text_length': len(text),
+            'word_count': len(text.split()),
+            'sentiment': self._analyze_sentiment(text)
+        }
+    
+    def _feat_numeric(self, data: List) -> Dict[str, Any]:
+        return {
+            'data_range': self._calculate_data_range(data),
+            'data_complexity': self._assess_data_complexity(data)
+        }
+    
+    def _feat_categories(self, categories: List[str]) -> Dict[str, Any]:
+        return {
+            'category_count': len(categories),
+            'primary_category': categories[0] if categories else 'unknown'
+        }
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _analyze_sentiment(text: str) -> float:
+        """Simple sentiment analysis (memoized: streams often repeat the same text)"""
+        positive_count = negative_count = 0
+        for word in text.lower().split():
+            if word in _POSITIVE_WORDS:
+                positive_count += 1
+            elif word in _NEGATIVE_WORDS:
+                negative_count += 1
         
         total_sentiment_words = positive_count + negative_count
         if total_sentiment_words == 0:
@@ -341,16 +665,7 @@ class SensoryLayer(CascadeLayer):
     
     def _detect_temporal_pattern(self, packet: InformationPacket) -> str:
         """Detect temporal patterns in information"""
-        hour = packet.timestamp.hour
-        
-        if 6 <= hour < 12:
-            return "morning"
-        elif 12 <= hour < 18:
-            return "afternoon"
-        elif 18 <= hour < 22:
-            return "evening"
-        else:
-            return "night"
+        return _HOUR_TABLE[packet.timestamp.hour]
     
     def _assess_sensory_quality(self, packet: InformationPacket) -> float:
         """Assess quality of sensory input"""
@@ -369,7 +684,7 @@ class SensoryLayer(CascadeLayer):
         relevance = packet.content.get('relevance_score', 0.5)
         quality_factors.append(relevance)
         
-        return np.mean(quality_factors)
+        return _mean(quality_factors)
     
     def _calculate_priority_modifier(self, packet: InformationPacket) -> float:
         """Calculate priority modifier for sensory processing"""
@@ -404,7 +719,7 @@ class SensoryLayer(CascadeLayer):
         # Original coherence
         coherence_factors.append(packet.coherence_score)
         
-        return np.mean(coherence_factors) if coherence_factors else 0.5
+        return _mean(coherence_factors) if coherence_factors else 0.5
 
 class PreprocessingLayer(CascadeLayer):
     """Preprocessing layer - cleans and formats information"""
@@ -422,13 +737,15 @@ class PreprocessingLayer(CascadeLayer):
         processed_packets = []
         
         # Clean and normalize data
-        cleaned_content = await self._clean_and_normalize(packet)
+        cleaned_content = self._clean_and_normalize(packet)
         
         # Detect patterns
-        patterns = await self._detect_patterns(cleaned_content)
+        patterns = self._detect_patterns(cleaned_content)
+        # One confidence figure feeds the readiness check, priority and coherence below
+        pattern_confidence = self._calculate_pattern_confidence(patterns)
         
         # Prepare for integration
-        integration_ready = await self._prepare_for_integration(cleaned_content, patterns)
+        integration_ready = self._prepare_for_integration(cleaned_content, pattern_confidence)
         
         if integration_ready:
             processed_packet = InformationPacket(
@@ -439,14 +756,14 @@ class PreprocessingLayer(CascadeLayer):
                     'detected_patterns': patterns,
                     'preprocessing_metadata': {
                         'noise_level': self._assess_noise_level(packet),
-                        'pattern_confidence': self._calculate_pattern_confidence(patterns)
+                        'pattern_confidence': pattern_confidence
                     }
                 },
                 source_layer=CascadeLayerType.PREPROCESSING,
                 target_layer=CascadeLayerType.INTEGRATION,
                 timestamp=datetime.utcnow(),
-                priority=packet.priority * self._calculate_preprocessing_modifier(patterns),
-                coherence_score=self._enhance_coherence(packet.coherence_score, patterns),
+                priority=packet.priority * self._calculate_preprocessing_modifier(len(patterns), pattern_confidence),
+                coherence_score=self._enhance_coherence(packet.coherence_score, pattern_confidence),
                 integration_requirements=['pattern_matching', 'contextual_binding'],
                 metadata={'preprocessing_stage': 'pattern_detection', 'patterns_found': len(patterns)}
             )
@@ -455,13 +772,12 @@ class PreprocessingLayer(CascadeLayer):
         
         return processed_packets
     
-    async def _clean_and_normalize(self, packet: InformationPacket) -> Dict[str, Any]:
+    def _clean_and_normalize(self, packet: InformationPacket) -> Dict[str, Any]:
         """Clean and normalize packet content"""
-        content = packet.content.copy()
         cleaned_content = {}
         
-        # Remove noise and normalize
-        for key, value in content.items():
+        # Remove noise and normalize (the new dict is the only copy; other values pass through)
+        for key, value in packet.content.items():
             if key == 'text' and isinstance(value, str):
                 # Clean text
                 cleaned_text = self._clean_text(value)
@@ -477,20 +793,17 @@ class PreprocessingLayer(CascadeLayer):
     
     def _clean_text(self, text: str) -> str:
         """Clean text data"""
-        # Remove excessive whitespace
-        cleaned = ' '.join(text.split())
-        
-        # Remove very short or very long words (likely noise)
-        words = cleaned.split()
-        filtered_words = [w for w in words if 2 <= len(w) <= 20]
-        
-        return ' '.join(filtered_words)
+        # Collapse whitespace and remove very short or very long words (likely noise) in one split
+        return ' '.join([w for w in text.split() if 2 <= len(w) <= 20])
     
     def _normalize_numerical_data(self, data: List) -> List[float]:
         """Normalize numerical data"""
         if not data or not all(isinstance(x, (int, float)) for x in data):
             return data
         
+        if len(data) > _NUMERIC_KERNEL_MIN_LEN:
+            return _norm_minmax(np.asarray(data, dtype=np.float64)).tolist()
+        
         # Simple min-max normalization
         min_val = min(data)
         max_val = max(data)
@@ -500,7 +813,7 @@ class PreprocessingLayer(CascadeLayer):
         
         return [(x - min_val) / (max_val - min_val) for x in data]
     
-    async def _detect_patterns(self, content: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _detect_patterns(self, content: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Detect patterns in cleaned content"""
         patterns = []
         
@@ -526,10 +839,7 @@ class PreprocessingLayer(CascadeLayer):
         words = text.split()
         
         # Repetition patterns
-        word_counts = {}
-        for word in words:
-            word_counts[word] = word_counts.get(word, 0) + 1
-        
+        word_counts = Counter(words)
         repeated_words = [word for word, count in word_counts.items() if count > 1]
         if repeated_words:
             patterns.append({
@@ -539,7 +849,7 @@ class PreprocessingLayer(CascadeLayer):
             })
         
         # Length patterns
-        avg_word_length = np.mean([len(word) for word in words]) if words else 0
+        avg_word_length = sum(map(len, words)) / len(words) if words else 0
         if avg_word_length > 6:  # Long words might indicate technical content
             patterns.append({
                 'type': 'technical_language',
@@ -558,9 +868,10 @@ class PreprocessingLayer(CascadeLayer):
         
         # Trend patterns
         if all(isinstance(x, (int, float)) for x in data):
-            # Check for increasing trend
-            increasing = all(data[i] <= data[i+1] for i in range(len(data)-1))
-            decreasing = all(data[i] >= data[i+1] for i in range(len(data)-1))
+            # Check for increasing/decreasing trend over adjacent pairs
+            arr = np.asarray(data, dtype=np.float64)
+            increasing = bool((arr[:-1] <= arr[1:]).all())
+            decreasing = bool((arr[:-1] >= arr[1:]).all())
             
             if increasing:
                 patterns.append({
@@ -598,14 +909,13 @@ class PreprocessingLayer(CascadeLayer):
         patterns = []
         
         # Key presence patterns
-        common_keys = ['text', 'numerical_data', 'categories', 'metadata']
-        present_keys = [key for key in common_keys if key in content]
+        present_keys = [key for key in _COMMON_STRUCT_KEYS if key in content]
         
         if len(present_keys) >= 3:
             patterns.append({
                 'type': 'rich_structure',
                 'pattern': present_keys,
-                'confidence': len(present_keys) / len(common_keys)
+                'confidence': len(present_keys) / len(_COMMON_STRUCT_KEYS)
             })
         
         # Nesting patterns
@@ -627,6 +937,13 @@ class PreprocessingLayer(CascadeLayer):
         if not seq1:
             return 1.0
         
+        if (len(seq1) > _NUMERIC_KERNEL_MIN_LEN
+                and all(isinstance(x, (int, float)) for x in seq1)
+                and all(isinstance(x, (int, float)) for x in seq2)):
+            mse = _mse_normalized_pair(np.asarray(seq1, dtype=np.float64),
+                                       np.asarray(seq2, dtype=np.float64))
+            return max(0.0, 1.0 - mse)
+        
         # Normalize sequences
         norm_seq1 = self._normalize_numerical_data(seq1)
         norm_seq2 = self._normalize_numerical_data(seq2)
@@ -638,23 +955,23 @@ class PreprocessingLayer(CascadeLayer):
         return max(0.0, 1.0 - mse)
     
     def _count_nesting_levels(self, obj, level=0) -> int:
-        """Count nesting levels in data structure"""
-        if isinstance(obj, dict):
-            if not obj:
-                return level
-            return max(self._count_nesting_levels(v, level + 1) for v in obj.values())
-        elif isinstance(obj, list):
-            if not obj:
-                return level
-            return max(self._count_nesting_levels(item, level + 1) for item in obj)
-        else:
-            return level
-    
-    async def _prepare_for_integration(self, content: Dict[str, Any], patterns: List[Dict[str, Any]]) -> bool:
+        """Count nesting levels in data structure (iterative, so deep nesting can't hit the recursion limit)"""
+        deepest = level
+        stack = [(obj, level)]
+        while stack:
+            item, depth = stack.pop()
+            if isinstance(item, dict) and item:
+                stack.extend((v, depth + 1) for v in item.values())
+            elif isinstance(item, list) and item:
+                stack.extend((v, depth + 1) for v in item)
+            elif depth > deepest:
+                deepest = depth
+        return deepest
+    
+    def _prepare_for_integration(self, content: Dict[str, Any], pattern_confidence: float) -> bool:
         """Check if content is ready for integration"""
         # Must have sufficient patterns for integration
         pattern_threshold = self.preprocessing_rules['pattern_detection_threshold']
-        pattern_confidence = self._calculate_pattern_confidence(patterns)
         
         return pattern_confidence >= pattern_threshold
     
@@ -677,14 +994,16 @@ class PreprocessingLayer(CascadeLayer):
         # Check for data noise
         if 'numerical_data' in content:
             data = content['numerical_data']
+            # Only flat numeric series count; checked before converting, since np.asarray
+            # raises on ragged nested lists
             if data and all(isinstance(x, (int, float)) for x in data):
                 # Outliers might be noise
-                mean_val = np.mean(data)
-                std_val = np.std(data)
+                arr = np.asarray(data, dtype=np.float64)
+                mean_val = arr.mean()
+                std_val = arr.std()
                 if std_val > 0:
-                    outliers = [x for x in data if abs(x - mean_val) > 2 * std_val]
-                    noise_indicators += len(outliers)
-                    total_indicators += len(data)
+                    noise_indicators += int(np.count_nonzero(np.abs(arr - mean_val) > 2 * std_val))
+                    total_indicators += arr.size
         
         return noise_indicators / max(1, total_indicators)
     
@@ -694,21 +1013,18 @@ class PreprocessingLayer(CascadeLayer):
             return 0.0
         
         confidences = [p.get('confidence', 0.5) for p in patterns]
-        return np.mean(confidences)
+        return _mean(confidences)
     
-    def _calculate_preprocessing_modifier(self, patterns: List[Dict[str, Any]]) -> float:
+    def _calculate_preprocessing_modifier(self, pattern_count: int, pattern_confidence: float) -> float:
         """Calculate priority modifier based on preprocessing results"""
-        pattern_count = len(patterns)
-        pattern_confidence = self._calculate_pattern_confidence(patterns)
-        
         # More patterns with higher confidence = higher priority
         modifier = 1.0 + (pattern_count * pattern_confidence * 0.1)
         
         return min(2.0, modifier)  # Cap at 2x boost
     
-    def _enhance_coherence(self, original_coherence: float, patterns: List[Dict[str, Any]]) -> float:
+    def _enhance_coherence(self, original_coherence: float, pattern_confidence: float) -> float:
         """Enhance coherence score based on pattern detection"""
-        pattern_boost = self._calculate_pattern_confidence(patterns) * 0.2
+        pattern_boost = pattern_confidence * 0.2
         enhanced_coherence = original_coherence + pattern_boost
         
         return min(1.0, enhanced_coherence)
@@ -720,93 +1036,128 @@ class IntegrationLayer(CascadeLayer):
         super().__init__(CascadeLayerType.INTEGRATION, capacity=100)
         self.integration_window = timedelta(seconds=30)  # Window for integrating related packets
         self.pending_integrations: Dict[str, List[InformationPacket]] = {}
+        # Content fingerprint -> pending packet, to drop re-emitted duplicates
+        self._pending_fingerprints: Dict[int, InformationPacket] = {}
+        # Readiness bookkeeping, so a sweep only touches groups that are ready:
+        # one (_ts_us, group seq, group key) heap entry per pending packet,
+        # groups whose window has passed, and groups ready to integrate
+        self._group_seq: Dict[str, int] = {}
+        self._next_group_seq = count()
+        self._age_heap: List[Tuple[int, int, str]] = []
+        self._expired_groups: Set[str] = set()
+        self._ready_groups: Set[str] = set()
         
     async def _layer_specific_processing(self, packet: InformationPacket) -> List[InformationPacket]:
         """Integrate information packets"""
         processed_packets = []
         
-        # Find packets to integrate with
-        integration_candidates = await self._find_integration_candidates(packet)
-        
-        if integration_candidates:
-            # Perform integration
-            integrated_packet = await self._integrate_packets([packet] + integration_candidates)
-            if integrated_packet:
-                processed_packets.append(integrated_packet)
-        else:
-            # Store for future integration
-            await self._store_for_integration(packet)
+        # An exact duplicate of a pending packet is already waiting for integration,
+        # so it is neither matched nor stored again
+        if packet.content_fingerprint() not in self._pending_fingerprints:
+            # Find packets to integrate with
+            integration_candidates = self._find_integration_candidates(packet)
+            
+            if integration_candidates:
+                # Perform integration
+                integrated_packet = self._integrate_packets([packet] + integration_candidates)
+                if integrated_packet:
+                    processed_packets.append(integrated_packet)
+            else:
+                # Store for future integration
+                self._store_for_integration(packet)
         
         # Process any completed integrations
-        completed_integrations = await self._process_completed_integrations()
+        completed_integrations = self._process_completed_integrations()
         processed_packets.extend(completed_integrations)
         
         return processed_packets
     
-    async def _find_integration_candidates(self, packet: InformationPacket) -> List[InformationPacket]:
+    def _find_integration_candidates(self, packet: InformationPacket) -> List[InformationPacket]:
         """Find packets that can be integrated with the current packet"""
-        candidates = []
+        # Active packets first, then pending integrations
+        pool = [p for p in self.active_packets if p.packet_id != packet.packet_id]
+        for group_packets in self.pending_integrations.values():
+            pool.extend(group_packets)
+        if not pool:
+            return []
+        
+        # Temporal, requirement and type factors for the whole pool in one vectorized pass.
+        # Content similarity is at most 1.0, so a packet whose other three factors sum to
+        # no more than 4 * threshold - 1 can't pass and skips the per-pair content comparison.
+        timestamps = np.fromiter((p._ts_us for p in pool), dtype=np.int64, count=len(pool))
+        time_diff = np.abs(timestamps - packet._ts_us) / 1e6
+        temporal_sim = np.maximum(0.0, 1.0 - time_diff / 300)
+        
+        req_bits = packet._req_bits
+        req_overlap = np.fromiter(
+            (_requirement_overlap(req_bits, p._req_bits) for p in pool),
+            dtype=np.float64, count=len(pool)
+        )
         
-        # Look through active packets
-        for active_packet in self.active_packets:
-            if active_packet.packet_id != packet.packet_id:
-                similarity = await self._calculate_integration_similarity(packet, active_packet)
-                if similarity > 0.7:  # Threshold for integration
-                    candidates.append(active_packet)
+        type_ids = np.fromiter((_TYPE_INDEX[p.information_type] for p in pool), dtype=np.intp, count=len(pool))
+        type_sim = _TYPE_COMPAT[_TYPE_INDEX[packet.information_type], type_ids]
         
-        # Look through pending integrations
-        for group_packets in self.pending_integrations.values():
-            for pending_packet in group_packets:
-                similarity = await self._calculate_integration_similarity(packet, pending_packet)
-                if similarity > 0.7:
-                    candidates.append(pending_packet)
+        bound = temporal_sim + req_overlap + type_sim
+        required = 4 * _INTEGRATION_THRESHOLD - 1e-9  # factor sum needed, with float slack
         
-        return candidates[:3]  # Limit to 3 candidates for now
-    
-    async def _calculate_integration_similarity(self, packet1: InformationPacket, packet2: InformationPacket) -> float:
-        """Calculate similarity for integration purposes"""
-        similarity_factors = []
+        keys = packet._content_keys
+        candidates = []
+        for i in np.flatnonzero(bound > required - 1.0):
+            other = pool[i]
+            # Tighter bound from the cached key sets before walking values: content
+            # similarity is (key_overlap + value_sim) / 2, and value_sim is 0 without shared keys
+            n_common = len(keys & other._content_keys)
+            key_overlap = n_common / max(1, len(keys) + len(other._content_keys) - n_common)
+            if bound[i] + (key_overlap + (1.0 if n_common else 0.0)) / 2.0 <= required:
+                continue
+            # Exact check, first matches in pool order
+            if self._calculate_integration_similarity(packet, other) > _INTEGRATION_THRESHOLD:
+                candidates.append(other)
+                if len(candidates) == 3:  # Limit to 3 candidates for now
+                    break
         
+        return candidates
+    
+    def _calculate_integration_similarity(self, packet1: InformationPacket, packet2: InformationPacket) -> float:
+        """Calculate similarity for integration purposes (mean of four factors)"""
         # Content similarity
-        content_sim = self._calculate_content_similarity(packet1.content, packet2.content)
-        similarity_factors.append(content_sim)
+        content_sim = self._calculate_content_similarity(packet1, packet2)
         
         # Temporal similarity
-        time_diff = abs((packet1.timestamp - packet2.timestamp).total_seconds())
+        time_diff = abs(packet1._ts_us - packet2._ts_us) / 1e6
         temporal_sim = max(0.0, 1.0 - (time_diff / 300))  # 5 minutes window
-        similarity_factors.append(temporal_sim)
         
         # Integration requirements overlap
-        req1 = set(packet1.integration_requirements)
-        req2 = set(packet2.integration_requirements)
-        req_overlap = len(req1.intersection(req2)) / max(1, len(req1.union(req2)))
-        similarity_factors.append(req_overlap)
+        req_overlap = _requirement_overlap(packet1._req_bits, packet2._req_bits)
         
         # Information type compatibility
         type_compatibility = self._calculate_type_compatibility(packet1.information_type, packet2.information_type)
-        similarity_factors.append(type_compatibility)
         
-        return np.mean(similarity_factors)
+        return (content_sim + temporal_sim + req_overlap + type_compatibility) / 4
     
-    def _calculate_content_similarity(self, content1: Dict[str, Any], content2: Dict[str, Any]) -> float:
+    def _calculate_content_similarity(self, packet1: InformationPacket, packet2: InformationPacket) -> float:
         """Calculate content similarity between two packets"""
+        content1 = packet1.content
+        content2 = packet2.content
+        
         # Check for common keys
-        keys1 = set(content1.keys())
-        keys2 = set(content2.keys())
-        key_overlap = len(keys1.intersection(keys2)) / max(1, len(keys1.union(keys2)))
+        common_keys = packet1._content_keys & packet2._content_keys
+        n_union = len(packet1._content_keys) + len(packet2._content_keys) - len(common_keys)
+        key_overlap = len(common_keys) / max(1, n_union)
         
         # Check for similar values in common keys
         value_similarities = []
-        for key in keys1.intersection(keys2):
+        for key in common_keys:
             val1 = content1[key]
             val2 = content2[key]
             
             if isinstance(val1, str) and isinstance(val2, str):
                 # Text similarity
-                words1 = set(val1.lower().split())
-                words2 = set(val2.lower().split())
+                words1 = packet1._words(key)
+                words2 = packet2._words(key)
                 if words1 or words2:
-                    word_overlap = len(words1.intersection(words2)) / len(words1.union(words2))
+                    n_shared = len(words1 & words2)
+                    word_overlap = n_shared / (len(words1) + len(words2) - n_shared)
                     value_similarities.append(word_overlap)
             elif isinstance(val1, (int, float)) and isinstance(val2, (int, float)):
                 # Numerical similarity
@@ -814,49 +1165,25 @@ class IntegrationLayer(CascadeLayer):
                 num_sim = 1.0 - abs(val1 - val2) / max_val
                 value_similarities.append(max(0.0, num_sim))
         
-        value_sim = np.mean(value_similarities) if value_similarities else 0.0
+        value_sim = _mean(value_similarities)
         
         return (key_overlap + value_sim) / 2.0
     
     def _calculate_type_compatibility(self, type1: InformationType, type2: InformationType) -> float:
         """Calculate compatibility between information types"""
-        # Define compatibility matrix
-        compatibility_matrix = {
-            (InformationType.SENSORY_INPUT, InformationType.PROCESSED_DATA): 0.9,
-            (InformationType.PROCESSED_DATA, InformationType.PATTERN_RECOGNITION): 0.9,
-            (InformationType.PATTERN_RECOGNITION, InformationType.CONCEPTUAL_KNOWLEDGE): 0.8,
-            (InformationType.CONCEPTUAL_KNOWLEDGE, InformationType.META_KNOWLEDGE): 0.7,
-            (InformationType.META_KNOWLEDGE, InformationType.CONSCIOUS_AWARENESS): 0.6,
-        }
-        
-        # Check both directions
-        compatibility = compatibility_matrix.get((type1, type2), 0.0)
-        if compatibility == 0.0:
-            compatibility = compatibility_matrix.get((type2, type1), 0.0)
-        
-        # Same type is always compatible
-        if type1 == type2:
-            compatibility = 1.0
-        
-        return compatibility
+        return _TYPE_COMPAT_ROWS[_TYPE_INDEX[type1]][_TYPE_INDEX[type2]]
     
-    async def _integrate_packets(self, packets: List[InformationPacket]) -> Optional[InformationPacket]:
+    def _integrate_packets(self, packets: List[InformationPacket]) -> Optional[InformationPacket]:
         """Integrate multiple packets into one"""
         if len(packets) < 2:
             return None
         
         # Calculate integrated content
-        integrated_content = await self._merge_content([p.content for p in packets])
+        integrated_content = self._merge_content([p.content for p in packets])
         
         # Calculate integrated properties
-        avg_priority = np.mean([p.priority for p in packets])
-        avg_coherence = np.mean([p.coherence_score for p in packets])
-        
-        # Combine integration requirements
-        all_requirements = []
-        for packet in packets:
-            all_requirements.extend(packet.integration_requirements)
-        unique_requirements = list(set(all_requirements))
+        avg_priority = _mean([p.priority for p in packets])
+        avg_coherence = _mean([p.coherence_score for p in packets])
         
         # Create integrated packet
         integrated_packet = InformationPacket(
@@ -878,7 +1205,7 @@ class IntegrationLayer(CascadeLayer):
         
         return integrated_packet
     
-    async def _merge_content(self, contents: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _merge_content(self, contents: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Merge content from multiple packets"""
         merged = {}
         
@@ -889,41 +1216,20 @@ class IntegrationLayer(CascadeLayer):
         
         # Merge each key
         for key in all_keys:
-            values = [content.get(key) for content in contents if content.get(key) is not None]
+            values = [v for content in contents if (v := content.get(key)) is not None]
             
             if not values:
                 continue
             
             if key == 'text':
-                # Concatenate text with separators
-                merged[key] = ' | '.join(str(v) for v in values)
-            elif key == 'numerical_data':
-                # Combine numerical data
-                combined_data = []
-                for v in values:
-                    if isinstance(v, list):
-                        combined_data.extend(v)
-                    else:
-                        combined_data.append(v)
-                merged[key] = combined_data
+                # Concatenate text with separators, each distinct text once
+                merged[key] = ' | '.join(dict.fromkeys(map(str, values)))
+            elif key == 'numerical_data' or key == 'detected_patterns':
+                # Combine numerical data / patterns
+                merged[key] = list(_chain_values(values))
             elif key == 'categories':
-                # Combine and deduplicate categories
-                combined_categories = []
-                for v in values:
-                    if isinstance(v, list):
-                        combined_categories.extend(v)
-                    else:
-                        combined_categories.append(v)
-                merged[key] = list(set(combined_categories))
-            elif key == 'detected_patterns':
-                # Combine patterns
-                combined_patterns = []
-                for v in values:
-                    if isinstance(v, list):
-                        combined_patterns.extend(v)
-                    else:
-                        combined_patterns.append(v)
-                merged[key] = combined_patterns
+                # Combine and deduplicate categories, first occurrence first
+                merged[key] = list(dict.fromkeys(_chain_values(values)))
             else:
                 # For other keys, take the first non-null value
                 merged[key] = values[0]
@@ -932,34 +1238,43 @@ class IntegrationLayer(CascadeLayer):
     
     def _calculate_integration_strength(self, packets: List[InformationPacket]) -> float:
         """Calculate strength of integration"""
-        factors = []
+        n_packets = len(packets)
         
         # Number of packets integrated
-        count_factor = min(1.0, len(packets) / 5.0)
-        factors.append(count_factor)
+        count_factor = min(1.0, n_packets / 5.0)
         
         # Average coherence of source packets
-        avg_coherence = np.mean([p.coherence_score for p in packets])
-        factors.append(avg_coherence)
+        avg_coherence = _mean([p.coherence_score for p in packets])
+        
+        if n_packets < 2:
+            return (count_factor + avg_coherence) / 2
         
         # Temporal clustering (packets close in time integrate better)
-        if len(packets) > 1:
-            timestamps = [p.timestamp for p in packets]
-            time_span = (max(timestamps) - min(timestamps)).total_seconds()
-            temporal_factor = max(0.0, 1.0 - (time_span / 300))  # 5 minute window
-            factors.append(temporal_factor)
+        if n_packets == 2:
+            time_span = abs(packets[0]._ts_us - packets[1]._ts_us) / 1e6
+        else:
+            timestamps = [p._ts_us for p in packets]
+            time_span = (max(timestamps) - min(timestamps)) / 1e6
+        temporal_factor = max(0.0, 1.0 - (time_span / 300))  # 5 minute window
         
-        return np.mean(factors)
+        return (count_factor + avg_coherence + temporal_factor) / 3
     
-    async def _store_for_integration(self, packet: InformationPacket):
+    def _store_for_integration(self, packet: InformationPacket):
         """Store packet for future integration"""
         # Create integration group key based on content similarity
         group_key = self._generate_integration_group_key(packet)
         
-        if group_key not in self.pending_integrations:
-            self.pending_integrations[group_key] = []
+        packets = self.pending_integrations.get(group_key)
+        if packets is None:
+            packets = self.pending_integrations[group_key] = []
+            self._group_seq[group_key] = next(self._next_group_seq)
         
-        self.pending_integrations[group_key].append(packet)
+        packets.append(packet)
+        self._pending_fingerprints[packet.content_fingerprint()] = packet
+        heapq.heappush(self._age_heap, (packet._ts_us, self._group_seq[group_key], group_key))
+        
+        if len(packets) >= 5 or (len(packets) >= 2 and group_key in self._expired_groups):
+            self._ready_groups.add(group_key)
     
     def _generate_integration_group_key(self, packet: InformationPacket) -> str:
         """Generate key for grouping similar packets"""
@@ -970,40 +1285,43 @@ class IntegrationLayer(CascadeLayer):
         if 'primary_category' in packet.content:
             key_parts.append(packet.content['primary_category'])
         
-        if 'detected_patterns' in packet.content:
-            patterns = packet.content['detected_patterns']
-            if patterns:
-                pattern_types = [p.get('type', 'unknown') for p in patterns]
-                key_parts.extend(sorted(set(pattern_types)))
+        patterns = packet.content.get('detected_patterns')
+        if patterns:
+            key_parts.extend(sorted({p.get('type', 'unknown') for p in patterns}))
         
         return '_'.join(key_parts)
     
-    async def _process_completed_integrations(self) -> List[InformationPacket]:
+    def _process_completed_integrations(self) -> List[InformationPacket]:
         """Process integration groups that are ready"""
+        # A group's window has passed once any of its packets is older than the window
+        # (its oldest packet is older still)
+        cutoff = _epoch_us(datetime.utcnow() - self.integration_window)
+        age_heap = self._age_heap
+        while age_heap and age_heap[0][0] < cutoff:
+            _, seq, group_key = heapq.heappop(age_heap)
+            if self._group_seq.get(group_key) != seq:
+                continue  # entry for a group that was already integrated
+            self._expired_groups.add(group_key)
+            if len(self.pending_integrations[group_key]) >= 2:
+                self._ready_groups.add(group_key)
+        
+        if not self._ready_groups:
+            return []
+        
+        # Ready groups are either past the time window with 2+ packets or have
+        # enough packets (5+); integrate them in the order the groups were opened
         completed = []
-        groups_to_remove = []
-        
-        for group_key, packets in self.pending_integrations.items():
-            # Check if group is ready for integration
-            if len(packets) >= 2:
-                # Check if packets are within time window
-                oldest_time = min(p.timestamp for p in packets)
-                if datetime.utcnow() - oldest_time > self.integration_window:
-                    # Time window expired - integrate now
-                    integrated = await self._integrate_packets(packets)
-                    if integrated:
-                        completed.append(integrated)
-                    groups_to_remove.append(group_key)
-                elif len(packets) >= 5:
-                    # Enough packets for integration
-                    integrated = await self._integrate_packets(packets)
-                    if integrated:
-                        completed.append(integrated)
-                    groups_to_remove.append(group_key)
-        
-        # Remove processed groups
-        for group_key in groups_to_remove:
-            del self.pending_integrations[group_key]
+        for group_key in sorted(self._ready_groups, key=self._group_seq.__getitem__):
+            packets = self.pending_integrations.pop(group_key)
+            integrated = self._integrate_packets(packets)
+            if integrated:
+                completed.append(integrated)
+            
+            del self._group_seq[group_key]
+            self._expired_groups.discard(group_key)
+            for packet in packets:
+                self._pending_fingerprints.pop(packet.content_fingerprint(), None)
+        self._ready_groups.clear()
         
         return completed
 
@@ -1019,16 +1337,18 @@ class MetaCognitiveLayer(CascadeLayer):
             'knowledge_gaps': [],
             'learning_opportunities': []
         }
+        # Packet whose knowledge gaps / learning opportunities are not yet in metacognitive_state
+        self._cog_state_dirty: Optional[InformationPacket] = None
         
     async def _layer_specific_processing(self, packet: InformationPacket) -> List[InformationPacket]:
         """Process information with meta-cognitive awareness"""
         processed_packets = []
         
         # Assess cognitive state
-        await self._assess_cognitive_state(packet)
+        self._assess_cognitive_state(packet)
         
         # Generate meta-cognitive insights
-        insights = await self._generate_metacognitive_insights(packet)
+        insights = self._generate_metacognitive_insights(packet)
         
         # Create meta-cognitive packet
         if insights:
@@ -1038,7 +1358,7 @@ class MetaCognitiveLayer(CascadeLayer):
                 content={
                     'original_content': packet.content,
                     'metacognitive_insights': insights,
-                    'cognitive_state': self.metacognitive_state.copy(),
+                    'cognitive_state': self._cognitive_state_snapshot(),
                     'consciousness_indicators': self._calculate_consciousness_indicators(packet, insights)
                 },
                 source_layer=CascadeLayerType.META_COGNITIVE,
@@ -1058,7 +1378,7 @@ class MetaCognitiveLayer(CascadeLayer):
         
         return processed_packets
     
-    async def _assess_cognitive_state(self, packet: InformationPacket):
+    def _assess_cognitive_state(self, packet: InformationPacket):
         """Assess current cognitive state"""
         # Update cognitive load
         self.metacognitive_state['cognitive_load'] = len(self.active_packets) / self.capacity
@@ -1071,13 +1391,20 @@ class MetaCognitiveLayer(CascadeLayer):
         # Update processing efficiency
         self.metacognitive_state['processing_efficiency'] = self.performance_metrics['throughput']
         
-        # Identify knowledge gaps
-        await self._identify_knowledge_gaps(packet)
-        
-        # Identify learning opportunities
-        await self._identify_learning_opportunities(packet)
+        # Knowledge gaps and learning opportunities are only read from the meta-packet
+        # snapshot; identify them when one is taken
+        self._cog_state_dirty = packet
+    
+    def _cognitive_state_snapshot(self) -> Dict[str, Any]:
+        """Copy of metacognitive_state with gaps and opportunities for the last assessed packet"""
+        packet = self._cog_state_dirty
+        if packet is not None:
+            self._identify_knowledge_gaps(packet)
+            self._identify_learning_opportunities(packet)
+            self._cog_state_dirty = None
+        return self.metacognitive_state.copy()
     
-    async def _identify_knowledge_gaps(self, packet: InformationPacket):
+    def _identify_knowledge_gaps(self, packet: InformationPacket):
         """Identify gaps in knowledge"""
         gaps = []
         
@@ -1096,23 +1423,12 @@ class MetaCognitiveLayer(CascadeLayer):
     def _is_requirement_fulfilled(self, requirement: str, packet: InformationPacket) -> bool:
         """Check if an integration requirement is fulfilled"""
         # Simple heuristic - check if relevant content exists
-        content_str = str(packet.content).lower()
-        
-        requirement_keywords = {
-            'feature_binding': ['features', 'binding', 'association'],
-            'temporal_integration': ['temporal', 'time', 'sequence'],
-            'pattern_matching': ['pattern', 'match', 'similarity'],
-            'contextual_binding': ['context', 'background', 'environment'],
-            'conceptual_binding': ['concept', 'abstract', 'meaning'],
-            'semantic_integration': ['semantic', 'meaning', 'significance'],
-            'self_awareness': ['self', 'awareness', 'consciousness'],
-            'cognitive_monitoring': ['cognitive', 'monitoring', 'assessment']
-        }
-        
-        keywords = requirement_keywords.get(requirement, [requirement])
-        return any(keyword in content_str for keyword in keywords)
+        keywords = _REQUIREMENT_KEYWORDS.get(requirement)
+        if keywords is None:
+            return any(requirement in text for text in _iter_text_leaves(packet.content))
+        return not packet._keyword_hits().isdisjoint(keywords)
     
-    async def _identify_learning_opportunities(self, packet: InformationPacket):
+    def _identify_learning_opportunities(self, packet: InformationPacket):
         """Identify learning opportunities"""
         opportunities = []
         
@@ -1133,7 +1449,7 @@ class MetaCognitiveLayer(CascadeLayer):
         
         self.metacognitive_state['learning_opportunities'] = opportunities
     
-    async def _generate_metacognitive_insights(self, packet: InformationPacket) -> List[Dict[str, Any]]:
+    def _generate_metacognitive_insights(self, packet: InformationPacket) -> List[Dict[str, Any]]:
         """Generate meta-cognitive insights about the information"""
         insights = []
         
@@ -1236,13 +1552,11 @@ class MetaCognitiveLayer(CascadeLayer):
             factors.append(('meta_cognitive', 0.8))
         
         # Self-referential content
-        content_str = str(packet.content).lower()
-        self_refs = ['self', 'consciousness', 'awareness', 'thinking', 'knowing']
-        if any(ref in content_str for ref in self_refs):
+        if not packet._keyword_hits().isdisjoint(_SELF_REFS):
             factors.append(('self_referential', 0.7))
         
         if len(factors) >= 2:
-            avg_strength = np.mean([strength for _, strength in factors])
+            avg_strength = _mean([strength for _, strength in factors])
             return {
                 'type': 'consciousness_emergence_potential',
                 'confidence': avg_strength,
@@ -1270,8 +1584,10 @@ class MetaCognitiveLayer(CascadeLayer):
         # Self-awareness (presence of self-referential processing)
         self_awareness = 0.0
         for insight in insights:
-            if 'consciousness' in insight.get('type', '') or 'self' in insight.get('type', ''):
-                self_awareness = max(self_awareness, insight.get('confidence', 0.0))
+            if insight['type'] in _SELF_AWARENESS_INSIGHTS:
+                confidence = insight['confidence']
+                if confidence > self_awareness:
+                    self_awareness = confidence
         indicators['self_awareness'] = self_awareness
         
         # Meta-cognitive activity
@@ -1290,14 +1606,14 @@ class MetaCognitiveLayer(CascadeLayer):
         # Insight quality
         if insights:
             insight_confidences = [insight.get('confidence', 0.5) for insight in insights]
-            avg_insight_confidence = np.mean(insight_confidences)
+            avg_insight_confidence = _mean(insight_confidences)
             factors.append(avg_insight_confidence)
         
         # Meta-cognitive state consistency
         state_consistency = self._assess_state_consistency()
         factors.append(state_consistency)
         
-        return np.mean(factors)
+        return _mean(factors)
     
     def _assess_state_consistency(self) -> float:
         """Assess consistency of meta-cognitive state"""
@@ -1319,7 +1635,7 @@ class ConsciousnessLayer(CascadeLayer):
         self.consciousness_state = {
             'unified_awareness': 0.0,
             'attention_focus': None,
-            'working_memory': [],
+            'working_memory': deque(maxlen=7),  # Miller's 7±2; oldest items fall off
             'self_model': {},
             'global_workspace': {}
         }
@@ -1330,18 +1646,18 @@ class ConsciousnessLayer(CascadeLayer):
         processed_packets = []
         
         # Update consciousness state
-        await self._update_consciousness_state(packet)
+        self._update_consciousness_state(packet)
         
         # Check for consciousness emergence
-        consciousness_level = await self._assess_consciousness_emergence(packet)
+        consciousness_level = self._assess_consciousness_emergence(packet)
         
         if consciousness_level >= self.consciousness_threshold:
             # Consciousness emerged - create conscious awareness packet
-            conscious_packet = await self._create_conscious_awareness_packet(packet, consciousness_level)
+            conscious_packet = self._create_conscious_awareness_packet(packet, consciousness_level)
             processed_packets.append(conscious_packet)
             
             # Generate feedback cascades
-            feedback_signals = await self._generate_consciousness_feedback(packet, consciousness_level)
+            feedback_signals = self._generate_consciousness_feedback(packet, consciousness_level)
             
             # Store feedback for cascade system to process
             if hasattr(self, 'cascade_system'):
@@ -1350,7 +1666,7 @@ class ConsciousnessLayer(CascadeLayer):
         
         return processed_packets
     
-    async def _update_consciousness_state(self, packet: InformationPacket):
+    def _update_consciousness_state(self, packet: InformationPacket):
         """Update consciousness state with new information"""
         # Update unified awareness
         consciousness_indicators = packet.content.get('consciousness_indicators', {})
@@ -1374,11 +1690,10 @@ class ConsciousnessLayer(CascadeLayer):
             }
             
             # Limit workspace size
-            if len(self.consciousness_state['global_workspace']) > 10:
-                # Remove oldest or least important items
-                items = list(self.consciousness_state['global_workspace'].items())
-                items.sort(key=lambda x: (x[1]['importance'], x[1]['timestamp']))
-                self.consciousness_state['global_workspace'] = dict(items[-10:])
+            workspace = self.consciousness_state['global_workspace']
+            while len(workspace) > 10:
+                # Remove the least important (then oldest) item in place
+                del workspace[min(workspace, key=lambda k: (workspace[k]['importance'], workspace[k]['timestamp']))]
         
         # Update working memory
         if packet.information_type == InformationType.META_KNOWLEDGE:
@@ -1388,13 +1703,9 @@ class ConsciousnessLayer(CascadeLayer):
                 'coherence': packet.coherence_score,
                 'timestamp': packet.timestamp
             })
-            
-            # Limit working memory size
-            if len(self.consciousness_state['working_memory']) > 7:  # Miller's 7±2
-                self.consciousness_state['working_memory'] = self.consciousness_state['working_memory'][-7:]
         
         # Update self-model
-        await self._update_self_model(packet)
+        self._update_self_model(packet)
     
     def _summarize_content(self, content: Dict[str, Any]) -> str:
         """Create summary of packet content"""
@@ -1417,7 +1728,7 @@ class ConsciousnessLayer(CascadeLayer):
         
         return ' | '.join(summary_parts) if summary_parts else 'complex_information'
     
-    async def _update_self_model(self, packet: InformationPacket):
+    def _update_self_model(self, packet: InformationPacket):
         """Update self-model based on processing"""
         # Track processing capabilities
         if 'processing_stage' in packet.metadata:
@@ -1430,12 +1741,10 @@ class ConsciousnessLayer(CascadeLayer):
         if 'cognitive_load' in packet.metadata:
             load = packet.metadata['cognitive_load']
             if 'load_history' not in self.consciousness_state['self_model']:
-                self.consciousness_state['self_model']['load_history'] = []
+                # Keep only recent history
+                self.consciousness_state['self_model']['load_history'] = deque(maxlen=20)
             
             self.consciousness_state['self_model']['load_history'].append(load)
-            # Keep only recent history
-            if len(self.consciousness_state['self_model']['load_history']) > 20:
-                self.consciousness_state['self_model']['load_history'] = self.consciousness_state['self_model']['load_history'][-20:]
         
         # Track processing preferences
         if packet.coherence_score > 0.8:
@@ -1447,7 +1756,7 @@ class ConsciousnessLayer(CascadeLayer):
             # Increase preference for high-coherence processing types
             self.consciousness_state['self_model']['preferences'][processing_type] = min(1.0, current_preference + 0.1)
     
-    async def _assess_consciousness_emergence(self, packet: InformationPacket) -> float:
+    def _assess_consciousness_emergence(self, packet: InformationPacket) -> float:
         """Assess level of consciousness emergence"""
         emergence_factors = []
         
@@ -1466,7 +1775,7 @@ class ConsciousnessLayer(CascadeLayer):
         # Unified awareness indicators
         consciousness_indicators = packet.content.get('consciousness_indicators', {})
         if consciousness_indicators:
-            avg_indicator = np.mean(list(consciousness_indicators.values()))
+            avg_indicator = _mean(list(consciousness_indicators.values()))
             emergence_factors.append(avg_indicator)
         
         # Meta-cognitive insight quality
@@ -1482,18 +1791,18 @@ class ConsciousnessLayer(CascadeLayer):
         emergence_factors.append(integration_factor)
         
         # Calculate overall emergence level
-        emergence_level = np.mean(emergence_factors) if emergence_factors else 0.0
+        emergence_level = _mean(emergence_factors)
         
         return emergence_level
     
-    async def _create_conscious_awareness_packet(self, packet: InformationPacket, consciousness_level: float) -> InformationPacket:
+    def _create_conscious_awareness_packet(self, packet: InformationPacket, consciousness_level: float) -> InformationPacket:
         """Create packet representing conscious awareness"""
         # Create conscious content
         conscious_content = {
             'unified_awareness': {
                 'level': consciousness_level,
                 'workspace_content': self.consciousness_state['global_workspace'].copy(),
-                'working_memory': self.consciousness_state['working_memory'].copy(),
+                'working_memory': list(self.consciousness_state['working_memory']),
                 'self_model_summary': self._summarize_self_model()
             },
             'source_information': {
@@ -1558,15 +1867,8 @@ class ConsciousnessLayer(CascadeLayer):
     
     def _calculate_self_reference_level(self, packet: InformationPacket) -> float:
         """Calculate level of self-reference in packet"""
-        content_str = str(packet.content).lower()
-        
-        self_references = [
-            'self', 'consciousness', 'awareness', 'thinking', 'knowing',
-            'understanding', 'processing', 'cognitive', 'meta', 'reflection'
-        ]
-        
-        reference_count = sum(1 for ref in self_references if ref in content_str)
-        total_words = len(content_str.split())
+        reference_count = len(packet._keyword_hits() & _SELF_REFERENCE_WORDS)
+        total_words = len(packet._content_text().split())
         
         if total_words == 0:
             return 0.0
@@ -1600,7 +1902,7 @@ class ConsciousnessLayer(CascadeLayer):
         coherence = max(0.0, 1.0 - (std_span / avg_span))
         return min(1.0, coherence)
     
-    async def _generate_consciousness_feedback(self, packet: InformationPacket, consciousness_level: float) -> List[FeedbackSignal]:
+    def _generate_consciousness_feedback(self, packet: InformationPacket, consciousness_level: float) -> List[FeedbackSignal]:
         """Generate feedback signals from consciousness emergence"""
         feedback_signals = []
         
@@ -1692,6 +1994,7 @@ class ConsciousInformationCascadeSystem:
     
     async def _create_database_tables(self):
         """Create necessary database tables"""
+        import psycopg  # deferred: only the DB paths need it, and it is slow to import
         conn = await psycopg.AsyncConnection.connect(self.database_url)
         
         try:
@@ -1881,6 +2184,7 @@ class ConsciousInformationCascadeSystem:
     
     async def _persist_cascade_state(self, cascade_state: CascadeState):
         """Persist cascade state to database"""
+        import psycopg
         conn = await psycopg.AsyncConnection.connect(self.database_url)
         
         try:
@@ -1908,6 +2212,7 @@ class ConsciousInformationCascadeSystem:
     
     async def _log_consciousness_event(self, event: Dict[str, Any]):
         """Log consciousness emergence event"""
+        import psycopg
         conn = await psycopg.AsyncConnection.connect(self.database_url)
         
         try:
@@ -72,7 +72,9 @@ CREATE INDEX IF NOT EXISTS idx_user_memories_created_at ON user_memories(created
 CREATE INDEX IF NOT EXISTS idx_agent_sessions_user_id ON agent_sessions(user_id);
 CREATE INDEX IF NOT EXISTS idx_agent_sessions_session_id ON agent_sessions(session_id);
 
--- Vector similarity index (uncomment if using pgvector)
--- CREATE INDEX IF NOT EXISTS idx_user_memories_embedding ON user_memories USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100);
+-- Vector similarity index (uncomment if using pgvector with embedding as vector(1536)).
+-- Memory.get_user_memories orders by `embedding <=> query` so this index is used.
+-- CREATE INDEX IF NOT EXISTS idx_user_memories_embedding ON user_memories USING hnsw (embedding vector_cosine_ops);
+-- Existing databases: apply user_memories_indexes.sql. Run ANALYZE user_memories after bulk loads.
 
 COMMIT;
\ No newline at end of file
@@ -0,0 +1,29 @@
+-- Migration: indexes for filtered kNN over user_memories
+-- Safe to re-run. Apply to databases created from an older schema.sql.
+--
+-- Memory.get_user_memories filters on user_id and orders by
+-- `embedding <=> query`. With a selective user_id B-tree the planner can
+-- pre-filter to one user's rows and top-N sort them; the HNSW index covers
+-- the unfiltered / low-selectivity case. Run `ANALYZE user_memories;` again
+-- after bulk-loading memories so those selectivity estimates stay current.
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_user_memories_user_id ON user_memories(user_id);
+
+-- HNSW index only when pgvector is installed and embedding is a vector column
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'vector')
+       AND (SELECT format_type(atttypid, atttypmod)
+            FROM pg_attribute
+            WHERE attrelid = 'user_memories'::regclass
+              AND attname = 'embedding') LIKE 'vector%' THEN
+        EXECUTE 'CREATE INDEX IF NOT EXISTS idx_user_memories_embedding '
+                'ON user_memories USING hnsw (embedding vector_cosine_ops)';
+    END IF;
+END
+$$;
+
+ANALYZE user_memories;
+
+COMMIT;
@@ -5,21 +5,51 @@ Adds LLM selection, chat testing, and prompt customization for true agent indivi
 """
 
 import asyncio
+import hashlib
 import json
 import uuid
 import logging
 import math
+import sqlite3
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from pathlib import Path
 from enum import Enum
-import requests
+import httpx
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    # C ISO-8601 parser; profile loading parses one timestamp per stored answer/test
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:
+    _parse_datetime = datetime.fromisoformat
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Reasoning-style keywords used to score personality alignment of chat responses
+_PERSONALITY_KEYWORDS: Dict[str, frozenset] = {
+    "analytical": frozenset({"analysis", "systematic", "examine", "data", "evidence", "logical"}),
+    "creative": frozenset({"innovative", "imagine", "creative", "novel", "inspiration", "artistic"}),
+    "collaborative": frozenset({"together", "team", "collective", "cooperation", "shared", "community"}),
+    "empirical": frozenset({"research", "study", "experiment", "statistical", "evidence", "methodology"}),
+    "ethical": frozenset({"ethical", "moral", "responsible", "safety", "values", "principles"}),
+    "introspective": frozenset({"reflect", "consciousness", "awareness", "inner", "self", "mindful"})
+}
+
 class LLMProvider(Enum):
     """Available LLM providers for agent personalities"""
     OPENROUTER_GPT4 = "openai/gpt-4-turbo-preview"
@@ -29,6 +59,9 @@ class LLMProvider(Enum):
     OPENROUTER_MIXTRAL = "mistralai/mixtral-8x7b-instruct"
     OPENROUTER_QWEN = "qwen/qwen-72b-chat"
 
+# Direct value -> member lookup used when rebuilding stored LLM configs
+_PROVIDER_BY_VALUE: Dict[str, LLMProvider] = {provider.value: provider for provider in LLMProvider}
+
 @dataclass
 class AgentLLMConfig:
     """LLM configuration for each agent"""
@@ -41,6 +74,18 @@ class AgentLLMConfig:
     custom_system_prompt: str = ""
     reasoning_style: str = "analytical"  # analytical, creative, collaborative, empirical, ethical
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "provider": self.provider.value,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            "top_p": self.top_p,
+            "frequency_penalty": self.frequency_penalty,
+            "presence_penalty": self.presence_penalty,
+            "custom_system_prompt": self.custom_system_prompt,
+            "reasoning_style": self.reasoning_style
+        }
+
 @dataclass
 class PersonalityVector:
     """Core personality dimensions for each agent"""
@@ -55,21 +100,37 @@ class PersonalityVector:
     systematic_approach: float = 0.5
     adaptability: float = 0.5
 
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "analytical_thinking": self.analytical_thinking,
+            "creative_intuition": self.creative_intuition,
+            "collaborative_tendency": self.collaborative_tendency,
+            "risk_tolerance": self.risk_tolerance,
+            "empirical_focus": self.empirical_focus,
+            "ethical_sensitivity": self.ethical_sensitivity,
+            "humor_appreciation": self.humor_appreciation,
+            "introspective_depth": self.introspective_depth,
+            "systematic_approach": self.systematic_approach,
+            "adaptability": self.adaptability
+        }
+
     def distance_to(self, other: 'PersonalityVector') -> float:
         """Calculate Euclidean distance between personality vectors"""
-        self_values = list(asdict(self).values())
-        other_values = list(asdict(other).values())
-        
         # Calculate Euclidean distance using pure Python
-        squared_diffs = [(a - b) ** 2 for a, b in zip(self_values, other_values)]
+        squared_diffs = [
+            (getattr(self, name) - getattr(other, name)) ** 2 for name in _PV_FIELDS
+        ]
         return math.sqrt(sum(squared_diffs))
 
     def similarity_to(self, other: 'PersonalityVector') -> float:
         """Calculate similarity (0-1) between personality vectors"""
         distance = self.distance_to(other)
-        max_distance = math.sqrt(len(asdict(self)) * 1.0)
+        max_distance = math.sqrt(len(_PV_FIELDS) * 1.0)
         return 1.0 - (distance / max_distance)
 
+# Field names in declaration order; avoids a recursive asdict() copy per comparison
+_PV_FIELDS = tuple(PersonalityVector.__dataclass_fields__)
+
 @dataclass
 class QuestionAnswer:
     """A question-answer pair with metadata"""
@@ -82,6 +143,18 @@ class QuestionAnswer:
     adaptation_history: List[Dict[str, Any]]
     llm_metadata: Dict[str, Any]  # LLM provider, tokens used, etc.
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "question_id": self.question_id,
+            "question_text": self.question_text,
+            "answer_text": self.answer_text,
+            "confidence": self.confidence,
+            "timestamp": self.timestamp.isoformat(),
+            "source": self.source,
+            "adaptation_history": self.adaptation_history,
+            "llm_metadata": self.llm_metadata
+        }
+
 @dataclass
 class ChatTestResult:
     """Result of testing agent with chat interaction"""
@@ -94,6 +167,18 @@ class ChatTestResult:
     timestamp: datetime
     llm_metadata: Dict[str, Any]
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "test_id": self.test_id,
+            "agent_id": self.agent_id,
+            "test_prompt": self.test_prompt,
+            "agent_response": self.agent_response,
+            "personality_alignment_score": self.personality_alignment_score,
+            "uniqueness_score": self.uniqueness_score,
+            "timestamp": self.timestamp.isoformat(),
+            "llm_metadata": self.llm_metadata
+        }
+
 @dataclass
 class PersonalityProfile:
     """Complete personality profile for an agent"""
@@ -110,14 +195,71 @@ class PersonalityProfile:
     created_at: datetime
     last_updated: datetime
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Profile JSON payload; chat test history is stored separately"""
+        return {
+            "agent_id": self.agent_id,
+            "name": self.name,
+            "role": self.role,
+            "specialty": self.specialty,
+            "personality_vector": self.personality_vector.to_dict(),
+            "llm_config": self.llm_config.to_dict(),
+            "answered_questions": {q_id: qa.to_dict() for q_id, qa in self.answered_questions.items()},
+            "adaptation_rules": self.adaptation_rules,
+            "learning_history": self.learning_history,
+            "created_at": self.created_at.isoformat(),
+            "last_updated": self.last_updated.isoformat()
+        }
+
 class EnhancedPersonalityEngine:
     """Enhanced engine for managing adaptive agent personalities with LLM integration"""
     
-    def __init__(self, storage_path: str = "agent_personalities", openrouter_api_key: str = None):
+    # Template answers per reasoning style (fallback when LLM not available)
+    _TEMPLATE_ANSWERS = {
+        "analytical": "From an analytical perspective, {q} requires systematic examination of the underlying factors and their relationships.",
+        "creative": "Creatively speaking, {q} opens up fascinating possibilities that we should explore with innovative thinking.",
+        "collaborative": "This question about {q} would benefit from collective wisdom and diverse perspectives working together.",
+        "empirical": "To properly address {q}, we need empirical evidence and rigorous methodology with statistical validation.",
+        "ethical": "The ethical implications of {q} must be carefully considered with attention to safety and beneficial outcomes.",
+        "introspective": "Reflecting deeply on {q}, this touches on fundamental questions of consciousness and self-awareness."
+    }
+    _DEFAULT_TEMPLATE_ANSWER = "My perspective on {q} is shaped by my role as {role} and my focus on {specialty}."
+    
+    def __init__(self, storage_path: str = "agent_personalities", openrouter_api_key: str = None,
+                 chat_history_backend: str = "sqlite", response_cache_size: int = 4096,
+                 profile_format: str = "json"):
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(exist_ok=True)
         self.openrouter_api_key = openrouter_api_key
         
+        # On-disk profile encoding: "json" ({agent_id}_profile.json, read by other
+        # Genesis Prime tools) or "msgpack" ({agent_id}_profile.msgpack, compact
+        # and faster to encode/decode; use export_profile_json for a readable copy)
+        if profile_format not in ("json", "msgpack"):
+            raise ValueError(f"Unknown profile format: {profile_format}")
+        if profile_format == "msgpack" and msgspec is None:
+            raise ImportError("msgspec is required for profile_format='msgpack'")
+        self.profile_format = profile_format
+        
+        # Shared keep-alive connection pool for OpenRouter calls (created lazily)
+        self._http_client: Optional[httpx.AsyncClient] = None
+        
+        # LRU of successful LLM responses keyed by a hash of the request payload,
+        # so replayed (model, system prompt, prompt, sampling) tuples skip the API.
+        # Only temperature-0 calls are cached: sampled completions are meant to vary
+        self.response_cache_size = response_cache_size
+        self._response_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        
+        # Chat tests grow without bound, so they are appended to their own store
+        # instead of being re-serialized into the profile JSON each time:
+        # "sqlite" -> chat_tests table in storage.db, "jsonl" -> {agent_id}_tests.jsonl
+        if chat_history_backend not in ("sqlite", "jsonl"):
+            raise ValueError(f"Unknown chat history backend: {chat_history_backend}")
+        self.chat_history_backend = chat_history_backend
+        self.storage_db = self.storage_path / "storage.db"
+        if chat_history_backend == "sqlite":
+            self._init_storage_db()
+        
         # Enhanced agent templates with LLM configurations
         self.agent_templates = {
             "E-T": {
@@ -312,23 +454,37 @@ class EnhancedPersonalityEngine:
             "presence_penalty": agent_config.presence_penalty
         }
         
+        cache_key = None
+        if self.response_cache_size > 0 and agent_config.temperature == 0:
+            cache_key = hashlib.blake2b(json.dumps(data, sort_keys=True).encode(), digest_size=16).digest()
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                self._response_cache.move_to_end(cache_key)
+                return dict(cached)
+        
         try:
-            response = requests.post(
+            response = await self._get_http_client().post(
                 "https://openrouter.ai/api/v1/chat/completions",
                 headers=headers,
-                json=data,
-                timeout=30
+                json=data
             )
             response.raise_for_status()
             result = response.json()
             
-            return {
+            llm_result = {
                 "response": result["choices"][0]["message"]["content"],
                 "tokens_used": result.get("usage", {}).get("total_tokens", 0),
                 "model": agent_config.provider.value,
                 "cost": result.get("usage", {}).get("total_tokens", 0) * 0.00001  # Rough estimate
             }
             
+            if cache_key is not None:
+                self._response_cache[cache_key] = llm_result
+                if len(self._response_cache) > self.response_cache_size:
+                    self._response_cache.popitem(last=False)
+            
+            return dict(llm_result)
+            
         except Exception as e:
             logger.error(f"LLM call failed: {e}")
             return {
@@ -339,6 +495,21 @@ class EnhancedPersonalityEngine:
                 "error": str(e)
             }
     
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use"""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(30.0),
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+            )
+        return self._http_client
+    
+    async def close(self):
+        """Release pooled HTTP connections"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+    
     async def test_agent_chat(self, agent_id: str, test_prompt: str) -> ChatTestResult:
         """Test agent with a chat prompt to verify personality consistency"""
         
@@ -375,9 +546,9 @@ class EnhancedPersonalityEngine:
             llm_metadata=llm_result
         )
         
-        # Store test result
+        # Store test result (single row insert, profile JSON is left untouched)
         profile.chat_test_history.append(test_result)
-        await self._save_personality(profile)
+        await asyncio.to_thread(self._insert_chat_tests, [test_result])
         
         logger.info(f"Chat test completed for {profile.name}: alignment={personality_score:.2f}, uniqueness={uniqueness_score:.2f}")
         
@@ -387,17 +558,8 @@ class EnhancedPersonalityEngine:
         """Analyze how well the response aligns with the agent's personality"""
         
         # Simple keyword-based analysis (can be enhanced with more sophisticated NLP)
-        personality_keywords = {
-            "analytical": ["analysis", "systematic", "examine", "data", "evidence", "logical"],
-            "creative": ["innovative", "imagine", "creative", "novel", "inspiration", "artistic"],
-            "collaborative": ["together", "team", "collective", "cooperation", "shared", "community"],
-            "empirical": ["research", "study", "experiment", "statistical", "evidence", "methodology"],
-            "ethical": ["ethical", "moral", "responsible", "safety", "values", "principles"],
-            "introspective": ["reflect", "consciousness", "awareness", "inner", "self", "mindful"]
-        }
-        
         reasoning_style = profile.llm_config.reasoning_style
-        relevant_keywords = personality_keywords.get(reasoning_style, [])
+        relevant_keywords = _PERSONALITY_KEYWORDS.get(reasoning_style, frozenset())
         
         response_lower = response.lower()
         keyword_matches = sum(1 for keyword in relevant_keywords if keyword in response_lower)
@@ -429,10 +591,10 @@ class EnhancedPersonalityEngine:
         # In a full implementation, this would compare responses from all agents
         # to the same prompt and calculate semantic similarity
         
-        response_length = len(response.split())
-        vocabulary_diversity = len(set(response.lower().split()))
+        tokens = response.lower().split()
+        vocabulary_diversity = len(set(tokens))
         
-        uniqueness_score = min(1.0, vocabulary_diversity / max(1, response_length))
+        uniqueness_score = min(1.0, vocabulary_diversity / max(1, len(tokens)))
         
         return uniqueness_score
     
@@ -536,23 +698,8 @@ class EnhancedPersonalityEngine:
     async def _generate_template_answer(self, profile: PersonalityProfile, question: Dict) -> str:
         """Generate template-based answer (fallback when LLM not available)"""
         
-        personality = profile.personality_vector
-        reasoning_style = profile.llm_config.reasoning_style
-        
-        if reasoning_style == "analytical":
-            return f"From an analytical perspective, {question['text'].lower()} requires systematic examination of the underlying factors and their relationships."
-        elif reasoning_style == "creative":
-            return f"Creatively speaking, {question['text'].lower()} opens up fascinating possibilities that we should explore with innovative thinking."
-        elif reasoning_style == "collaborative":
-            return f"This question about {question['text'].lower()} would benefit from collective wisdom and diverse perspectives working together."
-        elif reasoning_style == "empirical":
-            return f"To properly address {question['text'].lower()}, we need empirical evidence and rigorous methodology with statistical validation."
-        elif reasoning_style == "ethical":
-            return f"The ethical implications of {question['text'].lower()} must be carefully considered with attention to safety and beneficial outcomes."
-        elif reasoning_style == "introspective":
-            return f"Reflecting deeply on {question['text'].lower()}, this touches on fundamental questions of consciousness and self-awareness."
-        else:
-            return f"My perspective on {question['text'].lower()} is shaped by my role as {profile.role} and my focus on {profile.specialty}."
+        template = self._TEMPLATE_ANSWERS.get(profile.llm_config.reasoning_style, self._DEFAULT_TEMPLATE_ANSWER)
+        return template.format(q=question["text"].lower(), role=profile.role, specialty=profile.specialty)
     
     async def run_comprehensive_agent_tests(self, test_prompts: List[str]) -> Dict[str, List[ChatTestResult]]:
         """Run comprehensive tests on all agents with multiple prompts"""
@@ -576,141 +723,248 @@ class EnhancedPersonalityEngine:
     
     def _load_existing_personalities(self):
         """Load existing personality profiles from storage"""
-        for profile_file in self.storage_path.glob("*_profile.json"):
-            try:
-                with open(profile_file, 'r') as f:
-                    data = json.load(f)
-                
-                # Reconstruct personality profile with enhanced fields
-                personality_vector = PersonalityVector(**data["personality_vector"])
-                
-                # Handle LLM config (may not exist in older profiles)
-                if "llm_config" in data:
-                    llm_config = AgentLLMConfig(
-                        provider=LLMProvider(data["llm_config"]["provider"]),
-                        temperature=data["llm_config"].get("temperature", 0.7),
-                        max_tokens=data["llm_config"].get("max_tokens", 2000),
-                        top_p=data["llm_config"].get("top_p", 0.9),
-                        frequency_penalty=data["llm_config"].get("frequency_penalty", 0.0),
-                        presence_penalty=data["llm_config"].get("presence_penalty", 0.0),
-                        custom_system_prompt=data["llm_config"].get("custom_system_prompt", ""),
-                        reasoning_style=data["llm_config"].get("reasoning_style", "analytical")
-                    )
-                else:
-                    # Default LLM config for older profiles
-                    llm_config = AgentLLMConfig(provider=LLMProvider.OPENROUTER_GPT4)
-                
-                answered_questions = {}
-                for q_id, q_data in data["answered_questions"].items():
-                    answered_questions[q_id] = QuestionAnswer(
-                        question_id=q_data["question_id"],
-                        question_text=q_data["question_text"],
-                        answer_text=q_data["answer_text"],
-                        confidence=q_data["confidence"],
-                        timestamp=datetime.fromisoformat(q_data["timestamp"]),
-                        source=q_data["source"],
-                        adaptation_history=q_data.get("adaptation_history", []),
-                        llm_metadata=q_data.get("llm_metadata", {})
-                    )
-                
-                # Handle chat test history (may not exist in older profiles)
-                chat_test_history = []
-                if "chat_test_history" in data:
-                    for test_data in data["chat_test_history"]:
-                        chat_test_history.append(ChatTestResult(
-                            test_id=test_data["test_id"],
-                            agent_id=test_data["agent_id"],
-                            test_prompt=test_data["test_prompt"],
-                            agent_response=test_data["agent_response"],
-                            personality_alignment_score=test_data["personality_alignment_score"],
-                            uniqueness_score=test_data["uniqueness_score"],
-                            timestamp=datetime.fromisoformat(test_data["timestamp"]),
-                            llm_metadata=test_data.get("llm_metadata", {})
-                        ))
-                
-                profile = PersonalityProfile(
-                    agent_id=data["agent_id"],
-                    name=data["name"],
-                    role=data["role"],
-                    specialty=data["specialty"],
-                    personality_vector=personality_vector,
-                    llm_config=llm_config,
-                    answered_questions=answered_questions,
-                    chat_test_history=chat_test_history,
-                    adaptation_rules=data["adaptation_rules"],
-                    learning_history=data["learning_history"],
-                    created_at=datetime.fromisoformat(data["created_at"]),
-                    last_updated=datetime.fromisoformat(data["last_updated"])
+        # One file per agent; if both encodings exist, prefer the configured one
+        files_by_agent: Dict[str, Path] = {}
+        for profile_file in self.storage_path.glob("*_profile.*"):
+            if profile_file.suffix not in (".json", ".msgpack"):
+                continue
+            agent_key = profile_file.stem
+            if agent_key not in files_by_agent or profile_file.suffix == f".{self.profile_format}":
+                files_by_agent[agent_key] = profile_file
+        
+        profile_files = [files_by_agent[agent_key] for agent_key in sorted(files_by_agent)]
+        if not profile_files:
+            return
+        
+        # Each profile is independent disk + parse work, so overlap them in a pool
+        with ThreadPoolExecutor(max_workers=min(8, len(profile_files))) as pool:
+            for profile in pool.map(self._load_one, profile_files):
+                if profile is not None:
+                    self.personalities[profile.agent_id] = profile
+    
+    def _load_one(self, profile_file: Path) -> Optional[PersonalityProfile]:
+        """Load a single personality profile file (runs on a worker thread)"""
+        try:
+            raw = profile_file.read_bytes()
+            if profile_file.suffix == ".msgpack":
+                if msgspec is None:
+                    raise ImportError("msgspec is required to read msgpack profiles")
+                data = msgspec.msgpack.decode(raw)
+            else:
+                data = self._decode_profile_json(raw)
+            
+            # Reconstruct personality profile with enhanced fields
+            personality_vector = PersonalityVector(**data["personality_vector"])
+            
+            # Handle LLM config (may not exist in older profiles)
+            if "llm_config" in data:
+                llm_config = AgentLLMConfig(
+                    provider=_PROVIDER_BY_VALUE[data["llm_config"]["provider"]],
+                    temperature=data["llm_config"].get("temperature", 0.7),
+                    max_tokens=data["llm_config"].get("max_tokens", 2000),
+                    top_p=data["llm_config"].get("top_p", 0.9),
+                    frequency_penalty=data["llm_config"].get("frequency_penalty", 0.0),
+                    presence_penalty=data["llm_config"].get("presence_penalty", 0.0),
+                    custom_system_prompt=data["llm_config"].get("custom_system_prompt", ""),
+                    reasoning_style=data["llm_config"].get("reasoning_style", "analytical")
                 )
-                
-                self.personalities[profile.agent_id] = profile
-                logger.info(f"Loaded enhanced personality profile for {profile.name}")
-                
-            except Exception as e:
-                logger.error(f"Error loading personality from {profile_file}: {e}")
+            else:
+                # Default LLM config for older profiles
+                llm_config = AgentLLMConfig(provider=LLMProvider.OPENROUTER_GPT4)
+            
+            answered_questions = {}
+            for q_id, q_data in data["answered_questions"].items():
+                answered_questions[q_id] = QuestionAnswer(
+                    question_id=q_data["question_id"],
+                    question_text=q_data["question_text"],
+                    answer_text=q_data["answer_text"],
+                    confidence=q_data["confidence"],
+                    timestamp=_parse_datetime(q_data["timestamp"]),
+                    source=q_data["source"],
+                    adaptation_history=q_data.get("adaptation_history", []),
+                    llm_metadata=q_data.get("llm_metadata", {})
+                )
+            
+            # Older profiles embedded chat test history in the JSON file;
+            # migrate anything not yet in the chat test store
+            legacy_tests = [
+                self._chat_test_from_record(test_data)
+                for test_data in data.get("chat_test_history", [])
+            ]
+            chat_test_history = self._load_chat_tests(data["agent_id"])
+            known_test_ids = {test.test_id for test in chat_test_history}
+            legacy_tests = [test for test in legacy_tests if test.test_id not in known_test_ids]
+            if legacy_tests:
+                self._insert_chat_tests(legacy_tests)
+                chat_test_history = self._load_chat_tests(data["agent_id"])
+            
+            profile = PersonalityProfile(
+                agent_id=data["agent_id"],
+                name=data["name"],
+                role=data["role"],
+                specialty=data["specialty"],
+                personality_vector=personality_vector,
+                llm_config=llm_config,
+                answered_questions=answered_questions,
+                chat_test_history=chat_test_history,
+                adaptation_rules=data["adaptation_rules"],
+                learning_history=data["learning_history"],
+                created_at=_parse_datetime(data["created_at"]),
+                last_updated=_parse_datetime(data["last_updated"])
+            )
+            
+            logger.info(f"Loaded enhanced personality profile for {profile.name}")
+            return profile
+            
+        except Exception as e:
+            logger.error(f"Error loading personality from {profile_file}: {e}")
+            return None
+    
+    def _init_storage_db(self):
+        """Create the chat test store if it does not exist yet"""
+        with sqlite3.connect(self.storage_db) as conn:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS chat_tests (
+                    test_id TEXT PRIMARY KEY,
+                    agent_id TEXT NOT NULL,
+                    test_prompt TEXT NOT NULL,
+                    agent_response TEXT NOT NULL,
+                    personality_alignment_score REAL NOT NULL,
+                    uniqueness_score REAL NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    llm_metadata TEXT NOT NULL
+                )"""
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_chat_tests_agent ON chat_tests (agent_id, timestamp)")
+        conn.close()
+    
+    @staticmethod
+    def _chat_test_from_record(test_data: Dict[str, Any]) -> ChatTestResult:
+        """Rebuild a chat test result from its serialized form"""
+        return ChatTestResult(
+            test_id=test_data["test_id"],
+            agent_id=test_data["agent_id"],
+            test_prompt=test_data["test_prompt"],
+            agent_response=test_data["agent_response"],
+            personality_alignment_score=test_data["personality_alignment_score"],
+            uniqueness_score=test_data["uniqueness_score"],
+            timestamp=_parse_datetime(test_data["timestamp"]),
+            llm_metadata=test_data.get("llm_metadata", {})
+        )
+    
+    def _chat_tests_jsonl_path(self, agent_id: str) -> Path:
+        return self.storage_path / f"{agent_id}_tests.jsonl"
+    
+    def _insert_chat_tests(self, tests: List[ChatTestResult]):
+        """Append chat test results to the store (blocking, run via asyncio.to_thread)"""
+        if self.chat_history_backend == "jsonl":
+            self._append_chat_tests_jsonl(tests)
+            return
+        
+        rows = [
+            (
+                test.test_id,
+                test.agent_id,
+                test.test_prompt,
+                test.agent_response,
+                test.personality_alignment_score,
+                test.uniqueness_score,
+                test.timestamp.isoformat(),
+                json.dumps(test.llm_metadata)
+            )
+            for test in tests
+        ]
+        with sqlite3.connect(self.storage_db) as conn:
+            conn.executemany("INSERT OR IGNORE INTO chat_tests VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        conn.close()
+    
+    def _append_chat_tests_jsonl(self, tests: List[ChatTestResult]):
+        """Append one JSON line per chat test to each agent's shard"""
+        by_agent: Dict[str, List[str]] = {}
+        for test in tests:
+            by_agent.setdefault(test.agent_id, []).append(json.dumps(test.to_dict()) + "\n")
+        
+        for agent_id, lines in by_agent.items():
+            with open(self._chat_tests_jsonl_path(agent_id), 'a') as f:
+                f.writelines(lines)
+    
+    def _load_chat_tests(self, agent_id: str) -> List[ChatTestResult]:
+        """Read an agent's chat test history from the store in chronological order"""
+        if self.chat_history_backend == "jsonl":
+            path = self._chat_tests_jsonl_path(agent_id)
+            if not path.exists():
+                return []
+            with open(path, 'r') as f:
+                return [self._chat_test_from_record(json.loads(line)) for line in f if line.strip()]
+        
+        with sqlite3.connect(self.storage_db) as conn:
+            rows = conn.execute(
+                "SELECT * FROM chat_tests WHERE agent_id = ? ORDER BY timestamp",
+                (agent_id,)
+            ).fetchall()
+        conn.close()
+        
+        return [
+            ChatTestResult(
+                test_id=row[0],
+                agent_id=row[1],
+                test_prompt=row[2],
+                agent_response=row[3],
+                personality_alignment_score=row[4],
+                uniqueness_score=row[5],
+                timestamp=_parse_datetime(row[6]),
+                llm_metadata=json.loads(row[7])
+            )
+            for row in rows
+        ]
     
     async def _save_personality(self, profile: PersonalityProfile):
         """Save personality profile to storage with enhanced fields"""
         
-        # Convert to serializable format
-        data = {
-            "agent_id": profile.agent_id,
-            "name": profile.name,
-            "role": profile.role,
-            "specialty": profile.specialty,
-            "personality_vector": asdict(profile.personality_vector),
-            "llm_config": {
-                "provider": profile.llm_config.provider.value,
-                "temperature": profile.llm_config.temperature,
-                "max_tokens": profile.llm_config.max_tokens,
-                "top_p": profile.llm_config.top_p,
-                "frequency_penalty": profile.llm_config.frequency_penalty,
-                "presence_penalty": profile.llm_config.presence_penalty,
-                "custom_system_prompt": profile.llm_config.custom_system_prompt,
-                "reasoning_style": profile.llm_config.reasoning_style
-            },
-            "answered_questions": {},
-            "chat_test_history": [],
-            "adaptation_rules": profile.adaptation_rules,
-            "learning_history": profile.learning_history,
-            "created_at": profile.created_at.isoformat(),
-            "last_updated": profile.last_updated.isoformat()
-        }
-        
-        # Convert answered questions
-        for q_id, qa in profile.answered_questions.items():
-            data["answered_questions"][q_id] = {
-                "question_id": qa.question_id,
-                "question_text": qa.question_text,
-                "answer_text": qa.answer_text,
-                "confidence": qa.confidence,
-                "timestamp": qa.timestamp.isoformat(),
-                "source": qa.source,
-                "adaptation_history": qa.adaptation_history,
-                "llm_metadata": qa.llm_metadata
-            }
-        
-        # Convert chat test history
-        for test in profile.chat_test_history:
-            data["chat_test_history"].append({
-                "test_id": test.test_id,
-                "agent_id": test.agent_id,
-                "test_prompt": test.test_prompt,
-                "agent_response": test.agent_response,
-                "personality_alignment_score": test.personality_alignment_score,
-                "uniqueness_score": test.uniqueness_score,
-                "timestamp": test.timestamp.isoformat(),
-                "llm_metadata": test.llm_metadata
-            })
+        # Convert to serializable format (chat test history lives in its own store)
+        data = profile.to_dict()
         
         # Save to file
-        filename = f"{profile.agent_id}_profile.json"
-        filepath = self.storage_path / filename
+        if self.profile_format == "msgpack":
+            filepath = self.storage_path / f"{profile.agent_id}_profile.msgpack"
+            payload = msgspec.msgpack.encode(data)
+        else:
+            filepath = self.storage_path / f"{profile.agent_id}_profile.json"
+            payload = self._encode_profile_json(data)
         
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Write off the event loop so concurrent agent operations keep running
+        await asyncio.to_thread(filepath.write_bytes, payload)
         
         logger.info(f"Saved enhanced personality profile for {profile.name}")
+    
+    async def export_profile_json(self, agent_id: str, filepath: Optional[Path] = None) -> Path:
+        """Write a human-readable JSON copy of an agent's profile"""
+        
+        if agent_id not in self.personalities:
+            raise ValueError(f"Agent {agent_id} not found")
+        
+        if filepath is None:
+            filepath = self.storage_path / f"{agent_id}_profile.json"
+        
+        payload = self._encode_profile_json(self.personalities[agent_id].to_dict())
+        await asyncio.to_thread(filepath.write_bytes, payload)
+        
+        return filepath
+    
+    @staticmethod
+    def _encode_profile_json(data: Dict[str, Any]) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        return json.dumps(data, indent=2).encode()
+    
+    @staticmethod
+    def _decode_profile_json(raw: bytes) -> Dict[str, Any]:
+        if orjson is not None:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass  # e.g. NaN/Infinity written by the stdlib encoder
+        return json.loads(raw)
 
 # Example usage and testing
 async def main():
@@ -753,6 +1007,8 @@ async def main():
             print(f"  Uniqueness: {result.uniqueness_score:.2f}")
             print(f"  Response: {result.agent_response[:100]}...")
             print()
+    
+    await engine.close()
 
 if __name__ == "__main__":
     asyncio.run(main())
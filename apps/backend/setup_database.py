@@ -79,6 +79,55 @@ async def load_questions():
         print(f"❌ Error loading questions: {e}")
         return False
 
+async def copy_questions():
+    """
+    Bulk-load questions straight from Thousand_Questions.txt with COPY.
+
+    Parses the raw file (off the event loop) and streams the rows into a
+    staging table with one COPY, then merges with ON CONFLICT DO NOTHING,
+    instead of executing one INSERT per question from tq_questions.sql.
+    Needs the repo's libs/ directory on PYTHONPATH.
+    """
+    from tq_dataset.parse_tq import parse_raw_file
+
+    txt_path = Path(__file__).parent.parent.parent / "libs" / "tq_dataset" / "Thousand_Questions.txt"
+    if not txt_path.exists():
+        print(f"❌ Questions file not found: {txt_path}")
+        return False
+
+    questions = await asyncio.to_thread(parse_raw_file, txt_path)
+
+    try:
+        async with await psycopg.AsyncConnection.connect(DATABASE_URL) as conn:
+            await conn.execute(
+                "CREATE TEMP TABLE tq_questions_stage "
+                "(LIKE tq_questions INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+            async with conn.cursor() as cur:
+                async with cur.copy(
+                    "COPY tq_questions_stage "
+                    "(id, text, category, themes, complexity, related_ids) FROM STDIN"
+                ) as copy:
+                    for q in questions:
+                        await copy.write_row((
+                            q["id"],
+                            f" {q['text']} ",  # same padding the tq_questions.sql INSERTs store
+                            q["category"],
+                            q["themes"],
+                            q["complexity"],
+                            q["related_questions"],
+                        ))
+            await conn.execute("""
+                INSERT INTO tq_questions (id, text, category, themes, complexity, related_ids)
+                SELECT id, text, category, themes, complexity, related_ids FROM tq_questions_stage
+                ON CONFLICT (id) DO NOTHING
+            """)
+        print(f"✅ Copied {len(questions)} questions into database")
+        return True
+    except Exception as e:
+        print(f"❌ Error loading questions: {e}")
+        return False
+
 async def verify_setup():
     """Verify the database setup"""
     try:
@@ -88,7 +88,7 @@ class SentientAgent:
     async def ask_sample_questions(self, user_id: str, n: int) -> List[Dict]:
         """Get stratified sample of questions for user to answer"""
         try:
-            questions = sample_questions(user_id, n)
+            questions = await sample_questions(user_id, n)
             return questions
         except Exception as e:
             print(f"Error sampling questions: {e}")
@@ -98,7 +98,7 @@ class SentientAgent:
     async def build_persona(self, user_id: str) -> Dict[str, Any]:
         """Extract personality traits from user's sample answers"""
         try:
-            traits_dict = extract_traits(user_id)
+            traits_dict = await extract_traits(user_id)
             
             # Store traits in user_profiles table
             await self._store_user_profile(user_id, traits_dict)
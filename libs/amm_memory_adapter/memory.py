@@ -3,24 +3,54 @@ AMM-compatible memory adapter for Thousand Questions system
 Provides the same interface as agno.memory.v2 but works with our PostgreSQL schema
 """
 import uuid
+import hashlib
+from array import array
+from collections import OrderedDict
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 import json
 import asyncio
+from contextlib import asynccontextmanager
 import psycopg
 from psycopg.rows import dict_row
 import openai
 
+try:
+    from psycopg_pool import AsyncConnectionPool
+except ImportError:
+    AsyncConnectionPool = None
+
+EMBEDDING_MODEL = "text-embedding-3-large"
+
+# Maximum number of inputs OpenAI accepts in one embeddings request
+EMBEDDING_BATCH_LIMIT = 2048
+
+# Shared (Redis) embedding cache entries expire after a week
+EMBEDDING_CACHE_TTL = 7 * 24 * 3600
+
+def _embedding_cache_key(text: str) -> bytes:
+    return hashlib.blake2b(f"{EMBEDDING_MODEL}:{text}".encode(), digest_size=16).digest()
+
 class Memory:
     """
     AMM-compatible memory class for persistent conversation memory
     """
     
-    def __init__(self, model: str, memory_db, enable_vector_index: bool = False):
+    def __init__(self, model: str, memory_db, enable_vector_index: bool = False,
+                 hnsw_ef_search: Optional[int] = None, embedding_cache_size: int = 4096,
+                 embedding_cache_redis=None):
         self.model = model
         self.memory_db = memory_db
         self.enable_vector_index = enable_vector_index
-        self.openai_client = openai.OpenAI()
+        # Optional pgvector HNSW search breadth (recall vs. latency), applied per query
+        self.hnsw_ef_search = hnsw_ef_search
+        self.openai_client = openai.AsyncOpenAI()
+        
+        # Embeddings are memoized by content hash: an in-process LRU, optionally
+        # backed by a shared redis.asyncio client for multi-process deployments
+        self.embedding_cache_size = embedding_cache_size
+        self.embedding_cache_redis = embedding_cache_redis
+        self._embedding_cache: "OrderedDict[bytes, List[float]]" = OrderedDict()
         
     async def get_user_memories(self, user_id: str, limit: int = 5, query: Optional[str] = None) -> List[Dict]:
         """
@@ -31,30 +61,43 @@ class Memory:
         except ValueError:
             user_uuid = uuid.uuid4()  # Generate if invalid
             
-        conn = await self.memory_db.get_connection()
-        
+        query_embedding = None
         if query and self.enable_vector_index:
-            # Use vector similarity search
             query_embedding = await self._get_embedding(query)
-            memories = await conn.fetch("""
-                SELECT content, metadata, created_at,
-                       1 - (embedding <=> $3::vector) as similarity
-                FROM user_memories 
-                WHERE user_id = $1 
-                ORDER BY similarity DESC
-                LIMIT $2
-            """, user_uuid, limit, query_embedding)
-        else:
-            # Simple recency-based retrieval
-            memories = await conn.fetch("""
-                SELECT content, metadata, created_at
-                FROM user_memories 
-                WHERE user_id = $1 
-                ORDER BY created_at DESC 
-                LIMIT $2
-            """, user_uuid, limit)
         
-        await conn.close()
+        async with self.memory_db.acquire() as conn:
+            if query_embedding is not None:
+                if self.hnsw_ef_search:
+                    await conn.execute(f"SET LOCAL hnsw.ef_search = {int(self.hnsw_ef_search)}")
+                
+                # Use vector similarity search. The distance is computed once in
+                # the subselect; Postgres flattens it, so ORDER BY dist is still the
+                # raw `embedding <=> query` ordering pgvector's ANN index serves.
+                # For users with many memories the plan is an HNSW index scan that
+                # filters on user_id, so at most ef_search candidates are examined
+                # (raise hnsw_ef_search if such users get fewer than `limit` rows);
+                # small users take the user_id index and a top-N sort instead
+                cur = await conn.execute("""
+                    SELECT content, metadata, created_at, 1 - dist as similarity
+                    FROM (
+                        SELECT content, metadata, created_at,
+                               embedding <=> %s::vector as dist
+                        FROM user_memories 
+                        WHERE user_id = %s
+                    ) scored
+                    ORDER BY dist
+                    LIMIT %s
+                """, (query_embedding, user_uuid, limit))
+            else:
+                # Simple recency-based retrieval
+                cur = await conn.execute("""
+                    SELECT content, metadata, created_at
+                    FROM user_memories 
+                    WHERE user_id = %s 
+                    ORDER BY created_at DESC 
+                    LIMIT %s
+                """, (user_uuid, limit))
+            memories = await cur.fetchall()
         
         return [
             {
@@ -80,19 +123,23 @@ class Memory:
         if not memory_content:
             return
             
-        conn = await self.memory_db.get_connection()
+        # One embeddings request for the whole batch instead of one per memory
+        embeddings = [None] * len(memory_content)
+        if self.enable_vector_index:
+            embeddings = await self._get_embeddings([memory["content"] for memory in memory_content])
         
-        for memory in memory_content:
-            embedding = None
-            if self.enable_vector_index:
-                embedding = await self._get_embedding(memory["content"])
-                
-            await conn.execute("""
-                INSERT INTO user_memories (user_id, content, embedding, metadata)
-                VALUES ($1, $2, $3, $4)
-            """, user_uuid, memory["content"], embedding, json.dumps(memory.get("metadata", {})))
+        rows = [
+            (user_uuid, memory["content"], embedding, json.dumps(memory.get("metadata", {})))
+            for memory, embedding in zip(memory_content, embeddings)
+        ]
         
-        await conn.close()
+        # executemany pipelines the inserts: one round-trip for the batch
+        async with self.memory_db.acquire() as conn:
+            async with conn.cursor() as cur:
+                await cur.executemany("""
+                    INSERT INTO user_memories (user_id, content, embedding, metadata)
+                    VALUES (%s, %s, %s, %s)
+                """, rows)
     
     async def clear_user_memories(self, user_id: str) -> None:
         """Clear all memories for a user"""
@@ -101,9 +148,8 @@ class Memory:
         except ValueError:
             return
             
-        conn = await self.memory_db.get_connection()
-        await conn.execute("DELETE FROM user_memories WHERE user_id = $1", user_uuid)
-        await conn.close()
+        async with self.memory_db.acquire() as conn:
+            await conn.execute("DELETE FROM user_memories WHERE user_id = %s", (user_uuid,))
     
     async def search(self, user_id: str, query: str, top_k: int = 5) -> List[Dict]:
         """Search memories by semantic similarity"""
@@ -123,8 +169,7 @@ class Memory:
         conversation_text = "\n".join(conversation)
         
         try:
-            response = await asyncio.to_thread(
-                self.openai_client.chat.completions.create,
+            response = await self.openai_client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {
@@ -162,30 +207,163 @@ If no significant facts are found, return an empty array."""
     
     async def _get_embedding(self, text: str) -> List[float]:
         """Get embedding for text using OpenAI"""
+        return (await self._get_embeddings([text]))[0]
+    
+    async def _get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Get embeddings for several texts. Cached texts are served from the
+        embedding cache; the rest are requested in batches of up to
+        EMBEDDING_BATCH_LIMIT inputs, issued concurrently
+        """
+        if not texts:
+            return []
+        
+        keys = [_embedding_cache_key(text) for text in texts]
+        embeddings = await self._cache_lookup(keys)
+        
+        missing: Dict[bytes, str] = {}
+        for key, text, embedding in zip(keys, texts, embeddings):
+            if embedding is None:
+                missing[key] = text
+        
+        if missing:
+            missing_keys = list(missing)
+            chunks = [
+                missing_keys[start:start + EMBEDDING_BATCH_LIMIT]
+                for start in range(0, len(missing_keys), EMBEDDING_BATCH_LIMIT)
+            ]
+            results = await asyncio.gather(
+                *[self._embed_batch([missing[key] for key in chunk]) for chunk in chunks]
+            )
+            
+            fetched: Dict[bytes, List[float]] = {}
+            for chunk, chunk_embeddings in zip(chunks, results):
+                if chunk_embeddings is not None:
+                    fetched.update(zip(chunk, chunk_embeddings))
+            await self._cache_store(fetched)
+            
+            embeddings = [
+                embedding if embedding is not None
+                else fetched.get(key, [0.0] * 1536)  # Zero vector as fallback
+                for key, embedding in zip(keys, embeddings)
+            ]
+        
+        return embeddings
+    
+    async def _embed_batch(self, texts: List[str]) -> Optional[List[List[float]]]:
+        """Embed up to EMBEDDING_BATCH_LIMIT texts in a single request"""
         try:
-            response = await asyncio.to_thread(
-                self.openai_client.embeddings.create,
-                model="text-embedding-3-large",
-                input=text
+            response = await self.openai_client.embeddings.create(
+                model=EMBEDDING_MODEL,
+                input=texts
             )
-            return response.data[0].embedding
+            # Results carry their input index; don't rely on response order
+            return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
         except Exception as e:
-            print(f"Error getting embedding: {e}")
-            return [0.0] * 1536  # Return zero vector as fallback
+            print(f"Error getting embeddings: {e}")
+            return None
+    
+    async def _cache_lookup(self, keys: List[bytes]) -> List[Optional[List[float]]]:
+        """Look keys up in the local LRU, then in Redis for the local misses"""
+        embeddings: List[Optional[List[float]]] = []
+        for key in keys:
+            embedding = self._embedding_cache.get(key)
+            if embedding is not None:
+                self._embedding_cache.move_to_end(key)
+            embeddings.append(embedding)
+        
+        remote_indexes = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if self.embedding_cache_redis is not None and remote_indexes:
+            try:
+                values = await self.embedding_cache_redis.mget(
+                    [f"amm:embedding:{keys[i].hex()}" for i in remote_indexes]
+                )
+            except Exception as e:
+                print(f"Error reading embedding cache: {e}")
+                values = []
+            
+            for i, value in zip(remote_indexes, values):
+                if value:
+                    embeddings[i] = array("d", value).tolist()
+                    self._remember_embedding(keys[i], embeddings[i])
+        
+        return embeddings
+    
+    async def _cache_store(self, fetched: Dict[bytes, List[float]]) -> None:
+        for key, embedding in fetched.items():
+            self._remember_embedding(key, embedding)
+        
+        if self.embedding_cache_redis is not None and fetched:
+            try:
+                async with self.embedding_cache_redis.pipeline(transaction=False) as pipe:
+                    for key, embedding in fetched.items():
+                        pipe.set(f"amm:embedding:{key.hex()}", array("d", embedding).tobytes(), ex=EMBEDDING_CACHE_TTL)
+                    await pipe.execute()
+            except Exception as e:
+                print(f"Error writing embedding cache: {e}")
+    
+    def _remember_embedding(self, key: bytes, embedding: List[float]) -> None:
+        if self.embedding_cache_size <= 0:
+            return
+        self._embedding_cache[key] = embedding
+        self._embedding_cache.move_to_end(key)
+        if len(self._embedding_cache) > self.embedding_cache_size:
+            self._embedding_cache.popitem(last=False)
 
 class PostgresMemoryDb:
     """PostgreSQL memory database backend"""
     
-    def __init__(self, database_url: str, table_name: str = "user_memories"):
+    def __init__(self, database_url: str, table_name: str = "user_memories",
+                 min_pool_size: int = 5, max_pool_size: int = 20):
         self.database_url = database_url
         self.table_name = table_name
+        self.min_pool_size = min_pool_size
+        self.max_pool_size = max_pool_size
+        self._pool = None  # opened lazily on first use, inside the running event loop
+    
+    async def _get_pool(self):
+        if self._pool is None:
+            # Published before any await, so concurrent first callers share one pool
+            # and a caller cancelled while opening it can't orphan it
+            self._pool = AsyncConnectionPool(
+                self.database_url,
+                min_size=self.min_pool_size,
+                max_size=self.max_pool_size,
+                kwargs={"row_factory": dict_row},
+                open=False
+            )
+        pool = self._pool
+        await pool.open()  # no-op once open
+        return pool
+    
+    @asynccontextmanager
+    async def acquire(self):
+        """
+        Borrow a connection from the shared pool; the transaction is committed
+        when the block exits cleanly and rolled back on error
+        """
+        if AsyncConnectionPool is None:
+            # psycopg_pool not installed: fall back to a dedicated connection
+            async with await self.get_connection() as conn:
+                yield conn
+            return
+        
+        pool = await self._get_pool()
+        async with pool.connection() as conn:
+            yield conn
     
     async def get_connection(self):
-        """Get async database connection"""
+        """Get a dedicated (unpooled) async database connection"""
         return await psycopg.AsyncConnection.connect(
             self.database_url,
             row_factory=dict_row
         )
+    
+    async def close(self):
+        """Close the connection pool"""
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            await pool.close()
 
 class MemoryManager:
     """Higher-level memory management utilities"""
@@ -208,8 +386,7 @@ class MemoryManager:
         memory_context = "\n".join([f"- {m['content']}" for m in related_memories])
         
         try:
-            response = await asyncio.to_thread(
-                self.memory.openai_client.chat.completions.create,
+            response = await self.memory.openai_client.chat.completions.create(
                 model=self.memory.model,
                 messages=[
                     {
@@ -248,7 +425,7 @@ class SessionSummarizer:
     
     def __init__(self, model: str = "gpt-4o-mini"):
         self.model = model
-        self.openai_client = openai.OpenAI()
+        self.openai_client = openai.AsyncOpenAI()
     
     async def summarize(self, transcript: List[Dict]) -> str:
         """Summarize a conversation transcript"""
@@ -266,8 +443,7 @@ class SessionSummarizer:
         conversation_text = "\n".join(conversation)
         
         try:
-            response = await asyncio.to_thread(
-                self.openai_client.chat.completions.create,
+            response = await self.openai_client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {
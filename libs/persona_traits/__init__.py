@@ -3,6 +3,6 @@ Persona Traits Library
 Big Five personality trait extraction and management
 """
 
-from .builder import extract_traits, BIG_FIVE
+from .builder import extract_traits, invalidate_traits, BIG_FIVE
 
-__all__ = ["extract_traits", "BIG_FIVE"]
\ No newline at end of file
+__all__ = ["extract_traits", "invalidate_traits", "BIG_FIVE"]
\ No newline at end of file
@@ -4,6 +4,6 @@ Parser and sampler for the TQ personality profiling system
 """
 
 from .parse_tq import parse_raw_file, get_question_statistics
-from .sampler import sample_questions
+from .sampler import sample_questions, iter_sample_questions
 
-__all__ = ["parse_raw_file", "get_question_statistics", "sample_questions"]
\ No newline at end of file
+__all__ = ["parse_raw_file", "get_question_statistics", "sample_questions", "iter_sample_questions"]
\ No newline at end of file
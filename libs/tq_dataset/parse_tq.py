@@ -8,11 +8,15 @@ Usage (from repo root):
 
 Optional:
     --json-out libs/tq_dataset/tq_questions.json
+    --copy     emit a COPY ... FROM STDIN bulk load instead of INSERTs
+               (load it with `psql -f`; drivers cannot run inline COPY data)
 """
 
 from __future__ import annotations
 
 import argparse
+import csv
+import io
 import json
 import re
 import textwrap
@@ -21,6 +25,11 @@ from pathlib import Path
 from typing import List, Dict
 from datetime import timezone
 
+try:
+    import orjson
+except ImportError:  # stdlib json fallback
+    orjson = None
+
 # ────────────────────────────────────────────────────────────────────────────────
 # Heuristic helpers – you can swap these for smarter NLP later
 # ────────────────────────────────────────────────────────────────────────────────
@@ -33,73 +42,122 @@ _THEMES_LOOKUP = {
     "mind": ["mindful", "present", "aware", "reflection"],
 }
 
-
-def extract_themes(text: str, category: str) -> List[str]:
-    text_low = text.lower()
-    hits = {cat for cat, kws in _THEMES_LOOKUP.items() if any(k in text_low for k in kws)}
+# One compiled alternation per theme / Big-Five dimension, so each check is a
+# single scan of the text. No \b anchors: matching stays substring-based
+# ("feel" still hits "feeling"), same as the original `k in text` tests.
+_THEME_PATTERNS = [
+    (cat, re.compile("|".join(map(re.escape, kws)))) for cat, kws in _THEMES_LOOKUP.items()
+]
+
+_DIMENSION_PATTERNS = [
+    ("openness", re.compile("imagine|creative|dream")),
+    ("conscientiousness", re.compile("plan|organize|goal")),
+    ("extraversion", re.compile("friend|party|social")),
+    ("agreeableness", re.compile("feel|care|empath")),
+    ("neuroticism", re.compile("worry|fear|anxious")),
+]
+
+
+# The helpers below accept an optional pre-lowered text / token list so the
+# parser can casefold and split each question once and share the result.
+def extract_themes(text: str, category: str, text_low: str | None = None) -> List[str]:
+    if text_low is None:
+        text_low = text.lower()
+    hits = {cat for cat, pattern in _THEME_PATTERNS if pattern.search(text_low)}
     # Always include the raw category as a theme anchor
     hits.add(category)
     return sorted(hits)
 
 
-def estimate_complexity(text: str) -> int:
+def estimate_complexity(text: str, tokens: List[str] | None = None) -> int:
     # Complexity on 1–5: a naive proxy based on length & punctuation
-    tokens = text.split()
+    if tokens is None:
+        tokens = text.split()
     length_score = min(len(tokens) // 8 + 1, 5)
     qmarks = text.count("?")
     comma_bonus = text.count(",") // 2
     return min(length_score + qmarks + comma_bonus, 5)
 
 
-def identify_knowledge_dependencies(text: str, category: str) -> List[str]:
+def identify_knowledge_dependencies(
+    text: str, category: str, text_low: str | None = None
+) -> List[str]:
+    if text_low is None:
+        text_low = text.lower()
     deps = []
-    if "memory" in text.lower():
+    if "memory" in text_low:
         deps.append("personal_memory")
-    if "value" in text.lower():
+    if "value" in text_low:
         deps.append("core_values")
-    if "relationship" in text.lower() or "friend" in text.lower():
+    if "relationship" in text_low or "friend" in text_low:
         deps.append("relationships")
     if category in {"wisdom", "mindfulness"}:
         deps.append("introspection")
     return deps
 
 
-def identify_personality_dimensions(text: str) -> List[str]:
-    dims = []
-    text_low = text.lower()
-    if any(w in text_low for w in ("imagine", "creative", "dream")):
-        dims.append("openness")
-    if any(w in text_low for w in ("plan", "organize", "goal")):
-        dims.append("conscientiousness")
-    if any(w in text_low for w in ("friend", "party", "social")):
-        dims.append("extraversion")
-    if any(w in text_low for w in ("feel", "care", "empath")):
-        dims.append("agreeableness")
-    if any(w in text_low for w in ("worry", "fear", "anxious")):
-        dims.append("neuroticism")
-    return dims
+def identify_personality_dimensions(text: str, text_low: str | None = None) -> List[str]:
+    if text_low is None:
+        text_low = text.lower()
+    return [dim for dim, pattern in _DIMENSION_PATTERNS if pattern.search(text_low)]
 
 
 # After all questions are loaded, we’ll relate similar ones by Levenshtein on stem;
 # for speed we keep a simple substring relation here.
-def establish_question_relationships(questions: List[Dict]) -> List[Dict]:
-    for q in questions:
-        rel = [
-            other["id"]
-            for other in questions
-            if other["id"] != q["id"]
-            and q["category"] == other["category"]
-            and any(tok in other["text"].lower() for tok in q["text"].lower().split()[:2])
-        ][:4]  # cap at 4 related items
-        q["related_questions"] = rel
+_MAX_RELATED = 4
+
+
+def establish_question_relationships(
+    questions: List[Dict], texts_low: List[str] | None = None
+) -> List[Dict]:
+    # Related = same-category questions (in file order) whose text contains one
+    # of this question's first two tokens. Questions share lead tokens heavily
+    # ("what", "how", ...), so each (category, token) is scanned once and only
+    # the first few hits are kept -- enough to fill the cap after dropping self.
+    if texts_low is None:
+        texts_low = [q["text"].lower() for q in questions]
+
+    by_category: Dict[str, List[tuple[int, str, str]]] = {}
+    for pos, q in enumerate(questions):
+        by_category.setdefault(q["category"], []).append((pos, q["id"], texts_low[pos]))
+
+    hits_cache: Dict[tuple[str, str], List[tuple[int, str]]] = {}
+
+    def first_hits(category: str, tok: str) -> List[tuple[int, str]]:
+        key = (category, tok)
+        hits = hits_cache.get(key)
+        if hits is None:
+            hits = []
+            for pos, q_id, text_low in by_category[category]:
+                if tok in text_low:
+                    hits.append((pos, q_id))
+                    if len(hits) > _MAX_RELATED:
+                        break
+            hits_cache[key] = hits
+        return hits
+
+    for pos, q in enumerate(questions):
+        candidates = {
+            hit
+            for tok in texts_low[pos].split()[:2]
+            for hit in first_hits(q["category"], tok)
+        }
+        q["related_questions"] = [
+            q_id for _, q_id in sorted(candidates) if q_id != q["id"]
+        ][:_MAX_RELATED]  # cap at 4 related items
     return questions
 
 
 # ────────────────────────────────────────────────────────────────────────────────
 # Core parser
 # ────────────────────────────────────────────────────────────────────────────────
+# spaces and any '&' left after the " & " replace become underscores
+_CAT_TRANSLATE = str.maketrans({" ": "_", "&": "_"})
+
+
 def parse_raw_file(path: Path) -> List[Dict]:
     questions: List[Dict] = []
+    texts_low: List[str] = []
     current_cat = "uncategorized"
 
     with path.open(encoding="utf-8") as fh:
@@ -108,42 +166,57 @@ def parse_raw_file(path: Path) -> List[Dict]:
                 continue  # skip blank lines
 
             # Category lines have no leading whitespace and often have '&' or capitalised words
-            if re.match(r"^[^ \t].+", line):
-                current_cat = (
-                    line.strip().lower()
-                    .replace(" & ", "_")
-                    .replace(" ", "_")
-                    .replace("&", "_")
-                )
+            # (first char not a space/tab, followed by more than just the newline)
+            first = line[0]
+            if first != " " and first != "\t" and line[1:2] not in ("", "\n"):
+                current_cat = line.strip().lower().replace(" & ", "_").translate(_CAT_TRANSLATE)
                 continue
 
             # Question lines (indent with spaces or bullet)
             question_text = line.lstrip(" -\t").rstrip()
             q_id = f"q_{len(questions):04d}"
+            # casefold / tokenize once, shared by every heuristic below
+            text_low = question_text.lower()
+            tokens = question_text.split()
 
             question = {
                 "id": q_id,
                 "text": question_text,
                 "category": current_cat,
-                "themes": extract_themes(question_text, current_cat),
-                "complexity": estimate_complexity(question_text),
+                "themes": extract_themes(question_text, current_cat, text_low),
+                "complexity": estimate_complexity(question_text, tokens),
                 "related_questions": [],  # filled later
                 "knowledge_dependencies": identify_knowledge_dependencies(
-                    question_text, current_cat
+                    question_text, current_cat, text_low
+                ),
+                "personality_dimensions": identify_personality_dimensions(
+                    question_text, text_low
                 ),
-                "personality_dimensions": identify_personality_dimensions(question_text),
             }
             questions.append(question)
+            texts_low.append(text_low)
 
-    questions = establish_question_relationships(questions)
+    questions = establish_question_relationships(questions, texts_low)
     return questions
 
 
 # ────────────────────────────────────────────────────────────────────────────────
 # Output helpers
 # ────────────────────────────────────────────────────────────────────────────────
-def dump_sql(questions: List[Dict], outfile: Path):
-    """Write INSERT statements for tq_questions into outfile."""
+def _pg_array_literal(items: List[str]) -> str:
+    """Postgres text[] literal, e.g. {"a","b"} (COPY input format)."""
+    quoted = (
+        '"' + item.replace("\\", "\\\\").replace('"', '\\"') + '"' for item in items
+    )
+    return "{" + ",".join(quoted) + "}"
+
+
+def dump_sql(questions: List[Dict], outfile: Path, copy: bool = False):
+    """Write INSERT statements (or a COPY bulk load) for tq_questions into outfile."""
+    if copy:
+        _dump_sql_copy(questions, outfile)
+        return
+
     header = textwrap.dedent(
         f"""\
         -- Auto-generated from Thousand_Questions.txt
@@ -173,6 +246,52 @@ def dump_sql(questions: List[Dict], outfile: Path):
     footer = "\nCOMMIT;\n"
     outfile.write_text(header + "\n".join(rows) + footer, encoding="utf-8")
 
+
+def _dump_sql_copy(questions: List[Dict], outfile: Path):
+    """
+    Same rows as dump_sql, loaded with one COPY into a staging table and a
+    single INSERT ... ON CONFLICT DO NOTHING, instead of one statement per row.
+    """
+    buf = io.StringIO()
+    buf.write(
+        textwrap.dedent(
+            f"""\
+            -- Auto-generated from Thousand_Questions.txt
+            -- Generated at {datetime.now(timezone.utc).isoformat()}
+            BEGIN;
+            CREATE TEMP TABLE tq_questions_stage (LIKE tq_questions INCLUDING DEFAULTS) ON COMMIT DROP;
+            COPY tq_questions_stage (id, text, category, themes, complexity, related_ids) FROM STDIN WITH (FORMAT csv);
+            """
+        )
+    )
+
+    writer = csv.writer(buf, lineterminator="\n")
+    for q in questions:
+        writer.writerow(
+            [
+                q["id"],
+                f" {q['text']} ",  # same padding the $$ ... $$ INSERT form stores
+                q["category"],
+                _pg_array_literal(q["themes"]),
+                q["complexity"],
+                _pg_array_literal(q["related_questions"]),
+            ]
+        )
+
+    buf.write(
+        textwrap.dedent(
+            """\
+            \\.
+            INSERT INTO tq_questions (id, text, category, themes, complexity, related_ids)
+            SELECT id, text, category, themes, complexity, related_ids FROM tq_questions_stage
+            ON CONFLICT (id) DO NOTHING;
+            COMMIT;
+            """
+        )
+    )
+    outfile.write_text(buf.getvalue(), encoding="utf-8")
+
+
 def get_question_statistics(questions: List[Dict]) -> Dict:
     """Get statistics about the question set"""
     categories = {}
@@ -207,6 +326,11 @@ def main():
     parser.add_argument("--infile", required=True, type=Path, help="Raw txt file")
     parser.add_argument("--sql-out", type=Path, help="Write INSERTs to .sql")
     parser.add_argument("--json-out", type=Path, help="Write structured JSON")
+    parser.add_argument(
+        "--copy",
+        action="store_true",
+        help="Write a COPY bulk load (for psql) instead of INSERTs",
+    )
 
     args = parser.parse_args()
 
@@ -214,11 +338,14 @@ def main():
     print(f"Parsed {len(questions)} questions across {len(set(q['category'] for q in questions))} categories.")
 
     if args.sql_out:
-        dump_sql(questions, args.sql_out)
+        dump_sql(questions, args.sql_out, copy=args.copy)
         print(f"SQL written → {args.sql_out}")
 
     if args.json_out:
-        args.json_out.write_text(json.dumps(questions, indent=2), encoding="utf-8")
+        if orjson is not None:
+            args.json_out.write_bytes(orjson.dumps(questions, option=orjson.OPT_INDENT_2))
+        else:
+            args.json_out.write_text(json.dumps(questions, indent=2), encoding="utf-8")
         print(f"JSON written → {args.json_out}")
 
 